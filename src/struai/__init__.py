@@ -4,6 +4,7 @@ from ._client import AsyncStruAI, StruAI
 from ._exceptions import (
     APIError,
     AuthenticationError,
+    BatchIngestError,
     ConnectionError,
     InternalServerError,
     JobFailedError,
@@ -63,6 +64,7 @@ __all__ = [
     "TimeoutError",
     "ConnectionError",
     "JobFailedError",
+    "BatchIngestError",
     "Point",
     "BBox",
     "TextSpan",
@@ -1,5 +1,8 @@
 """Base HTTP client with retry logic."""
 
+import json as _json
+import re
+import threading
 import time
 from typing import Any, Dict, Optional, Type, TypeVar, Union
 from urllib.parse import urlparse
@@ -20,12 +23,59 @@ from ._exceptions import (
 )
 from ._version import __version__
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 T = TypeVar("T", bound=BaseModel)
 RequestResult = Union[T, Dict[str, Any], bytes, None]
 
 DEFAULT_BASE_URL = "https://api.stru.ai"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_MAX_RETRIES = 2
+# One pooled, keep-alive connection set per client; every resource and project
+# handle created from the client reuses it. Idle sockets are kept for a minute
+# (httpx defaults to 5s) so interactive DocQuery sessions skip repeat handshakes.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# orjson reads integers wider than 64 bits as floats; bodies with a digit run this long
+# go to the stdlib decoder instead (a long numeric string only costs the fast path).
+_LONG_DIGIT_RUN = re.compile(rb"[0-9]{19}")
+
+
+def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    The result is always what ``json.loads`` returns: bodies orjson would read
+    differently (integers beyond 64 bits) or rejects (NaN/Infinity, lone surrogates,
+    a BOM) are decoded by the stdlib.
+    """
+    if orjson is not None and _LONG_DIGIT_RUN.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return _json.loads(content)
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Encode a JSON request body exactly as httpx's ``json=`` does.
+
+    orjson is not used here: it always serializes UUID and enum values and writes NaN
+    as null, and no option turns that off, so the same call would send a different
+    body depending on whether it is installed.
+    """
+    body = _json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return body.encode("utf-8")
 
 
 def _normalize_base_url(base_url: str) -> str:
@@ -56,14 +106,20 @@ class BaseClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self) -> httpx.Client:
+        # httpx.Client is thread-safe; the lock only guards lazy creation so that
+        # concurrent callers (e.g. JobBatch.wait_all) share one connection pool.
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self.base_url,
-                headers=self._default_headers(),
-                timeout=self.timeout,
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers=self._default_headers(),
+                        timeout=self.timeout,
+                        limits=DEFAULT_LIMITS,
+                    )
         return self._client
 
     def _default_headers(self) -> Dict[str, str]:
@@ -138,13 +194,21 @@ class BaseClient:
         """Make HTTP request with retry logic."""
         client = self._get_client()
         last_error: Optional[Exception] = None
+        # Encode once; retries resend the same bytes.
+        body = None if json is None else _encode_json(json)
 
         for attempt in range(self.max_retries + 1):
             try:
                 if files or data is not None:
                     response = client.request(method, path, data=data, files=files, params=params)
                 else:
-                    response = client.request(method, path, json=json, params=params)
+                    response = client.request(
+                        method,
+                        path,
+                        content=body,
+                        headers=_JSON_HEADERS if body is not None else None,
+                        params=params,
+                    )
 
                 self._handle_response_error(response)
 
@@ -157,7 +221,7 @@ class BaseClient:
                 if expect_bytes:
                     return response.content
 
-                result = response.json()
+                result = _decode_json(response.content)
                 if cast_to is not None:
                     return cast_to.model_validate(result)
                 return result
@@ -193,9 +257,12 @@ class BaseClient:
         return self._request("DELETE", path, **kwargs)
 
     def close(self) -> None:
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        # Detach under the creation lock so a concurrent _get_client can't hand out a
+        # client that is about to be closed.
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     def __enter__(self):
         return self
@@ -226,6 +293,7 @@ class AsyncBaseClient:
                 base_url=self.base_url,
                 headers=self._default_headers(),
                 timeout=self.timeout,
+                limits=DEFAULT_LIMITS,
             )
         return self._client
 
@@ -303,6 +371,7 @@ class AsyncBaseClient:
 
         client = await self._get_client()
         last_error: Optional[Exception] = None
+        body = None if json is None else _encode_json(json)
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -311,7 +380,13 @@ class AsyncBaseClient:
                         method, path, data=data, files=files, params=params
                     )
                 else:
-                    response = await client.request(method, path, json=json, params=params)
+                    response = await client.request(
+                        method,
+                        path,
+                        content=body,
+                        headers=_JSON_HEADERS if body is not None else None,
+                        params=params,
+                    )
 
                 self._handle_response_error(response)
 
@@ -323,7 +398,7 @@ class AsyncBaseClient:
                 if expect_bytes:
                     return response.content
 
-                result = response.json()
+                result = _decode_json(response.content)
                 if cast_to is not None:
                     return cast_to.model_validate(result)
                 return result
@@ -1,5 +1,5 @@
 """StruAI exceptions."""
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
@@ -101,3 +101,23 @@ class JobFailedError(StruAIError):
         super().__init__(message)
         self.job_id = job_id
         self.error = error
+
+
+class BatchIngestError(StruAIError):
+    """Some uploads in a ``sheets.add_many`` call failed.
+
+    ``results`` keeps input order and holds the job handles of uploads that were
+    queued (``None`` where the upload failed or was never started); ``errors`` maps
+    input indexes to the exceptions raised.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        results: List[Any],
+        errors: Dict[int, BaseException],
+    ):
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
@@ -95,6 +95,7 @@ class DocQuerySheetListResult(SDKBaseModel):
     entity_sheet_inventory: List[Dict[str, Any]] = Field(default_factory=list)
     totals: Dict[str, Any] = Field(default_factory=dict)
     mismatch_warnings: List[Dict[str, Any]] = Field(default_factory=list)
+    next_after_sheet_id: Optional[str] = None
 
 
 class DocQueryReferenceResolveResult(SDKBaseModel):
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from .common import SDKBaseModel
 
@@ -24,6 +24,12 @@ class ProjectListResponse(SDKBaseModel):
 
     projects: List[Project] = Field(default_factory=list)
 
+    @field_validator("projects", mode="before")
+    @classmethod
+    def _null_projects_as_empty(cls, value: Any) -> Any:
+        # "projects": null means no projects, the same as a missing key.
+        return [] if value is None else value
+
 
 class ProjectDeleteResult(SDKBaseModel):
     """Response for DELETE /v1/projects/{project_id}."""
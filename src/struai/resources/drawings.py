@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Hashable, Optional, Tuple, Union
 
 from .._exceptions import NotFoundError
 from ..models.drawings import DrawingCacheStatus, DrawingResult
@@ -14,27 +20,107 @@ if TYPE_CHECKING:
 
 Uploadable = Union[str, Path, bytes, BinaryIO]
 PreparedUpload = Tuple[dict, Optional[BinaryIO]]
+_PDF_MIME = "application/pdf"
+
+_HASH_CHUNK_SIZE = 256 * 1024
+
+# In-memory uploads at or below this size are posted directly: sending the bytes is
+# cheaper than a cache-probe round trip.
+DEFAULT_CACHE_PROBE_SKIP_BYTES = 256 * 1024
+
+
+def _should_probe_cache(file: Uploadable, skip_bytes: int) -> bool:
+    return not (isinstance(file, bytes) and len(file) <= skip_bytes)
+
+
+class _TTLMemo:
+    """Bounded, TTL-limited LRU memo; a ``ttl`` or ``maxsize`` of 0 disables it.
+
+    Used for ``/drawings/cache/{file_hash}`` probe results and for opt-in DocQuery
+    read caching.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
+
+
+@functools.lru_cache(maxsize=256)
+def _pdf_name_for(path_str: str) -> str:
+    """Upload filename for a PDF path (memoized for repeated per-page uploads)."""
+    return Path(path_str).name
 
 
 def _prepare_file(file: Uploadable) -> PreparedUpload:
     if isinstance(file, (str, Path)):
-        path = Path(file)
-        handle = open(path, "rb")
-        return {"file": (path.name, handle, "application/pdf")}, handle
+        path_str = os.fspath(file)
+        handle = open(path_str, "rb")
+        return {"file": (_pdf_name_for(path_str), handle, _PDF_MIME)}, handle
     if isinstance(file, bytes):
-        return {"file": ("document.pdf", file, "application/pdf")}, None
+        return {"file": ("document.pdf", file, _PDF_MIME)}, None
 
     name = getattr(file, "name", "document.pdf")
     if hasattr(name, "split"):
         name = Path(name).name
-    return {"file": (name, file, "application/pdf")}, None
+    return {"file": (name, file, _PDF_MIME)}, None
 
 
 class Drawings:
     """Tier 1 raw detection API (sync)."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(
+        self,
+        client: "BaseClient",
+        *,
+        cache_probe_skip_bytes: int = DEFAULT_CACHE_PROBE_SKIP_BYTES,
+    ):
         self._client = client
+        self._cache_probe_skip_bytes = cache_probe_skip_bytes
 
     def analyze(
         self,
@@ -50,7 +136,8 @@ class Drawings:
 
         if file is not None and file_hash is None:
             file_hash = self.compute_file_hash(file)
-            if self._check_cache(file_hash):
+            should_probe = _should_probe_cache(file, self._cache_probe_skip_bytes)
+            if should_probe and self._check_cache(file_hash):
                 file = None
 
         upload = None
@@ -91,8 +178,14 @@ class Drawings:
 class AsyncDrawings:
     """Tier 1 raw detection API (async)."""
 
-    def __init__(self, client: "AsyncBaseClient"):
+    def __init__(
+        self,
+        client: "AsyncBaseClient",
+        *,
+        cache_probe_skip_bytes: int = DEFAULT_CACHE_PROBE_SKIP_BYTES,
+    ):
         self._client = client
+        self._cache_probe_skip_bytes = cache_probe_skip_bytes
 
     async def analyze(
         self,
@@ -108,7 +201,8 @@ class AsyncDrawings:
 
         if file is not None and file_hash is None:
             file_hash = self.compute_file_hash(file)
-            if await self._check_cache(file_hash):
+            should_probe = _should_probe_cache(file, self._cache_probe_skip_bytes)
+            if should_probe and await self._check_cache(file_hash):
                 file = None
 
         upload = None
@@ -151,8 +245,18 @@ def _compute_file_hash(file: Uploadable) -> str:
 
     if isinstance(file, (str, Path)):
         with open(file, "rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                hasher.update(chunk)
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Empty files and non-mappable sources (pipes, some network mounts).
+                _hash_stream(hasher, handle)
+            else:
+                with mapped:
+                    view = memoryview(mapped)
+                    try:
+                        hasher.update(view)
+                    finally:
+                        view.release()
         return hasher.hexdigest()[:16]
 
     if isinstance(file, bytes):
@@ -166,8 +270,7 @@ def _compute_file_hash(file: Uploadable) -> str:
         except Exception:
             pos = None
 
-    for chunk in iter(lambda: file.read(8192), b""):
-        hasher.update(chunk)
+    _hash_stream(hasher, file)
 
     if pos is not None and hasattr(file, "seek"):
         try:
@@ -176,3 +279,8 @@ def _compute_file_hash(file: Uploadable) -> str:
             pass
 
     return hasher.hexdigest()[:16]
+
+
+def _hash_stream(hasher: "hashlib._Hash", stream: BinaryIO) -> None:
+    for chunk in iter(lambda: stream.read(_HASH_CHUNK_SIZE), b""):
+        hasher.update(chunk)
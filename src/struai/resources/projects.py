@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import random
+import re
+import threading
 import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
 
-from .._exceptions import JobFailedError, TimeoutError
+from .._exceptions import BatchIngestError, JobFailedError, TimeoutError
 from ..models.docquery import (
     DocQueryCropResult,
     DocQueryCypherResult,
@@ -24,17 +47,29 @@ from ..models.projects import (
     JobStatus,
     Project,
     ProjectDeleteResult,
+    ProjectListResponse,
     SheetDeleteResult,
     SheetIngestResponse,
     SheetResult,
 )
-from .drawings import _compute_file_hash
+from .drawings import (
+    DEFAULT_CACHE_PROBE_SKIP_BYTES,
+    _compute_file_hash,
+    _prepare_file,
+    _should_probe_cache,
+    _TTLMemo,
+)
 
 if TYPE_CHECKING:
     from .._base import AsyncBaseClient, BaseClient
 
 Uploadable = Union[str, Path, bytes, BinaryIO]
-PreparedUpload = Tuple[dict, Optional[BinaryIO]]
+T = TypeVar("T")
+U = TypeVar("U")
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_NEIGHBOR_MODES = frozenset(("graph", "spatial", "both"))
+_NEIGHBOR_DIRECTIONS = frozenset(("in", "out", "both"))
 
 
 # =============================================================================
@@ -42,20 +77,64 @@ PreparedUpload = Tuple[dict, Optional[BinaryIO]]
 # =============================================================================
 
 
+# Upper bound for one long-poll status request; kept well under the default HTTP timeout.
+_LONG_POLL_MAX_SECONDS = 30
+
+# Floor for poll delays so a zero interval cannot turn wait() into a busy loop.
+_MIN_POLL_INTERVAL = 0.05
+
+
+def _job_outcome(job_id: str, status: JobStatus) -> Optional[SheetResult]:
+    """Return the sheet result of a finished job, raise if it failed, else None."""
+    state = status.status
+    if state == "complete":
+        result = status.result
+        return SheetResult() if result is None else result
+    if state == "failed":
+        error = status.error
+        raise JobFailedError(
+            f"Job {job_id} failed: {error}",
+            job_id=job_id,
+            error=error or "Unknown error",
+        )
+    return None
+
+
+def _poll_delays(initial_interval: float, max_interval: float) -> Iterator[float]:
+    """Yield capped exponential backoff delays (x1.5) with +/-20% jitter."""
+    max_interval = max(_MIN_POLL_INTERVAL, max_interval)
+    delay = max(_MIN_POLL_INTERVAL, min(initial_interval, max_interval))
+    while True:
+        yield min(max_interval, delay * random.uniform(0.8, 1.2))
+        delay = min(max_interval, delay * 1.5)
+
+
+def _status_params(wait_seconds: Optional[float]) -> Optional[Dict[str, Any]]:
+    if wait_seconds is None:
+        return None
+    return {"wait_seconds": max(1, int(min(_LONG_POLL_MAX_SECONDS, wait_seconds)))}
+
+
 class Job:
     """Handle for one async sheet-ingestion job (sync)."""
 
+    __slots__ = ("_client", "_project_id", "_job_id", "_page", "_status_path", "_read_cache")
+
     def __init__(
         self,
         client: "BaseClient",
         project_id: str,
         job_id: str,
         page: Optional[int] = None,
+        *,
+        read_cache: Optional[_TTLMemo] = None,
     ):
         self._client = client
         self._project_id = project_id
         self._job_id = job_id
         self._page = page
+        self._status_path = f"/projects/{project_id}/jobs/{job_id}"
+        self._read_cache = read_cache
 
     @property
     def id(self) -> str:
@@ -65,47 +144,103 @@ class Job:
     def page(self) -> Optional[int]:
         return self._page
 
-    def status(self) -> JobStatus:
-        """Fetch current job status."""
-        return self._client.get(
-            f"/projects/{self._project_id}/jobs/{self._job_id}",
+    def status(self, *, wait_seconds: Optional[float] = None) -> JobStatus:
+        """Fetch current job status.
+
+        With ``wait_seconds`` the server may hold the request open (long-poll) until
+        the job changes state or the window elapses; capped at 30 seconds.
+        """
+        status = self._client.get(
+            self._status_path,
+            params=_status_params(wait_seconds),
             cast_to=JobStatus,
         )
+        self._settle_reads(status)
+        return status
 
-    def wait(self, timeout: float = 120, poll_interval: float = 2) -> SheetResult:
-        """Wait for completion and return resulting sheet info."""
-        start = time.time()
-        while time.time() - start < timeout:
-            status = self.status()
-            if status.is_complete:
-                if status.result is None:
-                    return SheetResult()
-                return status.result
-            if status.is_failed:
-                raise JobFailedError(
-                    f"Job {self._job_id} failed: {status.error}",
-                    job_id=self._job_id,
-                    error=status.error or "Unknown error",
-                )
-            time.sleep(poll_interval)
+    def _settle_reads(self, status: JobStatus) -> None:
+        # Finished ingest changes the project graph; drop cached reads once.
+        if self._read_cache is not None and status.status == "complete":
+            self._read_cache.clear()
+            self._read_cache = None
+
+    def wait(
+        self,
+        timeout: float = 120,
+        poll_interval: float = 2,
+        *,
+        initial_interval: float = 0.25,
+        long_poll: bool = False,
+    ) -> SheetResult:
+        """Wait for completion and return resulting sheet info.
+
+        Polls start ``initial_interval`` seconds apart and back off (x1.5, with jitter)
+        up to ``poll_interval``. Set ``long_poll=True`` to let the server block each
+        status request until the job changes state.
+        """
+        return self._wait(
+            timeout=timeout,
+            poll_interval=poll_interval,
+            initial_interval=initial_interval,
+            long_poll=long_poll,
+        )
 
+    def _wait(
+        self,
+        *,
+        timeout: float,
+        poll_interval: float,
+        initial_interval: float = 0.25,
+        long_poll: bool = False,
+        cancel: Optional[threading.Event] = None,
+    ) -> SheetResult:
+        # ``cancel`` is checked between polls so a failed wait_all() does not leave this
+        # thread polling (and holding up interpreter exit) until ``timeout``.
+        deadline = time.monotonic() + timeout
+        delays = _poll_delays(initial_interval, poll_interval)
+        while True:
+            started = time.monotonic()
+            if started >= deadline:
+                break
+            wait_seconds = deadline - started if long_poll else None
+            result = _job_outcome(self._job_id, self.status(wait_seconds=wait_seconds))
+            if result is not None:
+                return result
+            delay = next(delays)
+            if long_poll:
+                # Servers without long-poll support answer immediately; fall back to polling.
+                delay -= time.monotonic() - started
+            time.sleep(max(0.0, delay))
+            if cancel is not None and cancel.is_set():
+                raise CancelledError(f"Wait for job {self._job_id} was cancelled")
+
+        # One last look so a job that finished during the final sleep is not reported as timed out.
+        result = _job_outcome(self._job_id, self.status())
+        if result is not None:
+            return result
         raise TimeoutError(f"Job {self._job_id} did not complete within {timeout}s")
 
 
 class AsyncJob:
     """Handle for one async sheet-ingestion job (async)."""
 
+    __slots__ = ("_client", "_project_id", "_job_id", "_page", "_status_path", "_read_cache")
+
     def __init__(
         self,
         client: "AsyncBaseClient",
         project_id: str,
         job_id: str,
         page: Optional[int] = None,
+        *,
+        read_cache: Optional[_TTLMemo] = None,
     ):
         self._client = client
         self._project_id = project_id
         self._job_id = job_id
         self._page = page
+        self._status_path = f"/projects/{project_id}/jobs/{job_id}"
+        self._read_cache = read_cache
 
     @property
     def id(self) -> str:
@@ -115,30 +250,62 @@ class AsyncJob:
     def page(self) -> Optional[int]:
         return self._page
 
-    async def status(self) -> JobStatus:
-        """Fetch current job status."""
-        return await self._client.get(
-            f"/projects/{self._project_id}/jobs/{self._job_id}",
+    async def status(self, *, wait_seconds: Optional[float] = None) -> JobStatus:
+        """Fetch current job status.
+
+        With ``wait_seconds`` the server may hold the request open (long-poll) until
+        the job changes state or the window elapses; capped at 30 seconds.
+        """
+        status = await self._client.get(
+            self._status_path,
+            params=_status_params(wait_seconds),
             cast_to=JobStatus,
         )
+        self._settle_reads(status)
+        return status
 
-    async def wait(self, timeout: float = 120, poll_interval: float = 2) -> SheetResult:
-        """Wait for completion and return resulting sheet info."""
-        start = time.time()
-        while time.time() - start < timeout:
-            status = await self.status()
-            if status.is_complete:
-                if status.result is None:
-                    return SheetResult()
-                return status.result
-            if status.is_failed:
-                raise JobFailedError(
-                    f"Job {self._job_id} failed: {status.error}",
-                    job_id=self._job_id,
-                    error=status.error or "Unknown error",
-                )
-            await asyncio.sleep(poll_interval)
+    def _settle_reads(self, status: JobStatus) -> None:
+        # Finished ingest changes the project graph; drop cached reads once.
+        if self._read_cache is not None and status.status == "complete":
+            self._read_cache.clear()
+            self._read_cache = None
 
+    async def wait(
+        self,
+        timeout: float = 120,
+        poll_interval: float = 2,
+        *,
+        initial_interval: float = 0.25,
+        long_poll: bool = False,
+    ) -> SheetResult:
+        """Wait for completion and return resulting sheet info.
+
+        Polls start ``initial_interval`` seconds apart and back off (x1.5, with jitter)
+        up to ``poll_interval``. Set ``long_poll=True`` to let the server block each
+        status request until the job changes state.
+        """
+        import asyncio
+
+        deadline = time.monotonic() + timeout
+        delays = _poll_delays(initial_interval, poll_interval)
+        while True:
+            started = time.monotonic()
+            if started >= deadline:
+                break
+            wait_seconds = deadline - started if long_poll else None
+            result = _job_outcome(self._job_id, await self.status(wait_seconds=wait_seconds))
+            if result is not None:
+                return result
+            delay = next(delays)
+            if long_poll:
+                # Servers without long-poll support answer immediately; fall back to polling.
+                delay -= time.monotonic() - started
+            await asyncio.sleep(max(0.0, delay))
+
+        # One last look so a job that finished during the final sleep is not reported as timed out.
+        result = _job_outcome(self._job_id, await self.status())
+        if result is not None:
+            return result
         raise TimeoutError(f"Job {self._job_id} did not complete within {timeout}s")
 
 
@@ -148,19 +315,43 @@ class JobBatch:
     def __init__(self, jobs: List[Job]):
         self.jobs = jobs
 
-    @property
+    @cached_property
     def ids(self) -> List[str]:
+        """Job ids in batch order (computed once; ``jobs`` is not expected to change)."""
         return [job.id for job in self.jobs]
 
-    def status_all(self) -> List[JobStatus]:
-        return [job.status() for job in self.jobs]
+    def status_all(self, *, max_concurrency: Optional[int] = 8) -> List[JobStatus]:
+        return _map_threaded(
+            lambda job: job.status(),
+            self.jobs,
+            max_concurrency=max_concurrency,
+        )
 
     def wait_all(
         self,
         timeout_per_job: float = 120,
         poll_interval: float = 2,
+        *,
+        max_concurrency: Optional[int] = 8,
+        long_poll: bool = False,
     ) -> List[SheetResult]:
-        return [job.wait(timeout=timeout_per_job, poll_interval=poll_interval) for job in self.jobs]
+        """Wait for every job; the first failure is raised as soon as it happens.
+
+        The other waits stop at their next poll (or, with ``long_poll``, once the
+        current status request returns).
+        """
+        cancel = threading.Event()
+        return _map_threaded(
+            lambda job: job._wait(
+                timeout=timeout_per_job,
+                poll_interval=poll_interval,
+                long_poll=long_poll,
+                cancel=cancel,
+            ),
+            self.jobs,
+            max_concurrency=max_concurrency,
+            cancel=cancel,
+        )
 
 
 class AsyncJobBatch:
@@ -169,28 +360,174 @@ class AsyncJobBatch:
     def __init__(self, jobs: List[AsyncJob]):
         self.jobs = jobs
 
-    @property
+    @cached_property
     def ids(self) -> List[str]:
+        """Job ids in batch order (computed once; ``jobs`` is not expected to change)."""
         return [job.id for job in self.jobs]
 
-    async def status_all(self) -> List[JobStatus]:
-        return list(await asyncio.gather(*(job.status() for job in self.jobs)))
+    async def status_all(self, *, max_concurrency: Optional[int] = 8) -> List[JobStatus]:
+        return await _gather_bounded(
+            [job.status for job in self.jobs],
+            max_concurrency=max_concurrency,
+        )
 
     async def wait_all(
         self,
         timeout_per_job: float = 120,
         poll_interval: float = 2,
+        *,
+        max_concurrency: Optional[int] = 8,
+        long_poll: bool = False,
     ) -> List[SheetResult]:
-        return list(
-            await asyncio.gather(
-                *(
-                    job.wait(timeout=timeout_per_job, poll_interval=poll_interval)
-                    for job in self.jobs
+        return await _gather_bounded(
+            [
+                functools.partial(
+                    job.wait,
+                    timeout=timeout_per_job,
+                    poll_interval=poll_interval,
+                    long_poll=long_poll,
                 )
-            )
+                for job in self.jobs
+            ],
+            max_concurrency=max_concurrency,
         )
 
 
+def _thread_pool(count: int, max_concurrency: Optional[int]) -> ThreadPoolExecutor:
+    workers = count if max_concurrency is None else min(count, max_concurrency)
+    return ThreadPoolExecutor(max_workers=max(1, workers))
+
+
+def _map_threaded(
+    fn: Callable[[U], T],
+    items: List[U],
+    *,
+    max_concurrency: Optional[int],
+    cancel: Optional[threading.Event] = None,
+) -> List[T]:
+    """Apply ``fn`` to ``items`` on a thread pool, preserving input order.
+
+    The first failure (or Ctrl-C) is raised as soon as it happens and queued items
+    are cancelled. Calls already running cannot be interrupted: they finish in the
+    background, and because pool threads are joined at interpreter exit they can
+    still delay exit until they return. ``cancel`` is set when this returns or
+    raises, so calls that check it can stop early.
+    """
+    if len(items) <= 1 or max_concurrency == 1:
+        return [fn(item) for item in items]
+    executor = _thread_pool(len(items), max_concurrency)
+    futures = [executor.submit(fn, item) for item in items]
+    try:
+        for future in as_completed(futures):
+            future.result()
+    finally:
+        if cancel is not None:
+            cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [future.result() for future in futures]
+
+
+def _map_threaded_until_error(
+    fn: Callable[[U], T],
+    items: List[U],
+    *,
+    max_concurrency: Optional[int],
+) -> Tuple[List[Optional[T]], Dict[int, BaseException]]:
+    """Like ``_map_threaded``, but keep the results of calls that did succeed.
+
+    After the first failure no further items start; calls already running are waited
+    for so their results are not lost, so this returns only once they finish. On
+    Ctrl-C running calls are abandoned, but they are still joined at interpreter exit.
+    Returns per-item results (``None`` where the call failed or never started) and the
+    failures keyed by input index.
+    """
+    results: List[Optional[T]] = [None] * len(items)
+    errors: Dict[int, BaseException] = {}
+    if len(items) <= 1 or max_concurrency == 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = fn(item)
+            except Exception as exc:
+                errors[index] = exc
+                break
+        return results, errors
+
+    executor = _thread_pool(len(items), max_concurrency)
+    futures = [executor.submit(fn, item) for item in items]
+    try:
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                break
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True, cancel_futures=True)
+    for index, future in enumerate(futures):
+        if future.cancelled():
+            continue
+        error = future.exception()
+        if error is None:
+            results[index] = future.result()
+        else:
+            errors[index] = error
+    return results, errors
+
+
+async def _gather_bounded(
+    factories: List[Callable[[], Awaitable[T]]],
+    *,
+    max_concurrency: Optional[int],
+) -> List[T]:
+    """Run every factory's call concurrently, at most ``max_concurrency`` at a time.
+
+    Each call is only created once it holds the semaphore, so calls cancelled before
+    they start never exist as un-awaited coroutines. The first failure is raised as
+    soon as it happens and the remaining calls are cancelled.
+    """
+    import asyncio
+
+    limit = len(factories) if max_concurrency is None else max_concurrency
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(run(factory)) for factory in factories]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _gather_until_error(
+    factories: List[Callable[[], Awaitable[T]]],
+    *,
+    max_concurrency: Optional[int],
+) -> Tuple[List[Optional[T]], Dict[int, BaseException]]:
+    """Async twin of ``_map_threaded_until_error``; each factory starts one call."""
+    import asyncio
+
+    results: List[Optional[T]] = [None] * len(factories)
+    errors: Dict[int, BaseException] = {}
+    limit = len(factories) if max_concurrency is None else max_concurrency
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(index: int, factory: Callable[[], Awaitable[T]]) -> None:
+        async with semaphore:
+            if errors:
+                return
+            try:
+                results[index] = await factory()
+            except Exception as exc:
+                errors[index] = exc
+
+    await asyncio.gather(*(run(index, factory) for index, factory in enumerate(factories)))
+    return results, errors
+
+
 # =============================================================================
 # Helpers
 # =============================================================================
@@ -205,37 +542,67 @@ def _normalize_page_selector(page: Union[int, str]) -> str:
     return text
 
 
-def _prepare_file(file: Uploadable) -> PreparedUpload:
-    if isinstance(file, (str, Path)):
-        path = Path(file)
-        handle = open(path, "rb")
-        return {"file": (path.name, handle, "application/pdf")}, handle
-    if isinstance(file, bytes):
-        return {"file": ("document.pdf", file, "application/pdf")}, None
-
-    name = getattr(file, "name", "document.pdf")
-    if hasattr(name, "split"):
-        name = Path(name).name
-    return {"file": (name, file, "application/pdf")}, None
+def _build_sheet_data(
+    selector: str,
+    *,
+    file_hash: Optional[str],
+    source_description: Optional[str],
+    on_sheet_exists: Optional[str],
+    community_update_mode: Optional[str],
+    semantic_index_update_mode: Optional[str],
+) -> Dict[str, str]:
+    """Form fields for POST /projects/{id}/sheets; unset options are omitted."""
+    # Optional fields that are only sent when truthy.
+    options = (
+        ("file_hash", file_hash),
+        ("on_sheet_exists", on_sheet_exists),
+        ("community_update_mode", community_update_mode),
+        ("semantic_index_update_mode", semantic_index_update_mode),
+    )
+    data = {"page": selector, **{key: value for key, value in options if value}}
+    # An empty description is still sent; only None means "not provided".
+    if source_description is not None:
+        data["source_description"] = source_description
+    return data
+
+
+def _raise_for_ingest_errors(results: List[Any], errors: Dict[int, BaseException]) -> None:
+    if not errors:
+        return
+    first = errors[min(errors)]
+    queued = sum(result is not None for result in results)
+    raise BatchIngestError(
+        f"{len(errors)} of {len(results)} uploads failed ({queued} queued): {first}",
+        results=results,
+        errors=errors,
+    ) from first
 
 
 def _jobs_from_response(
     client: "BaseClient",
     project_id: str,
     payload: SheetIngestResponse,
+    *,
+    read_cache: Optional[_TTLMemo] = None,
 ) -> List[Job]:
     jobs: List[Job] = []
     for item in payload.jobs:
-        jobs.append(Job(client, project_id, item.job_id, page=item.page))
+        jobs.append(Job(client, project_id, item.job_id, page=item.page, read_cache=read_cache))
     return jobs
 
 
 def _async_jobs_from_response(
-    client: "AsyncBaseClient", project_id: str, payload: SheetIngestResponse
+    client: "AsyncBaseClient",
+    project_id: str,
+    payload: SheetIngestResponse,
+    *,
+    read_cache: Optional[_TTLMemo] = None,
 ) -> List[AsyncJob]:
     jobs: List[AsyncJob] = []
     for item in payload.jobs:
-        jobs.append(AsyncJob(client, project_id, item.job_id, page=item.page))
+        jobs.append(
+            AsyncJob(client, project_id, item.job_id, page=item.page, read_cache=read_cache)
+        )
     return jobs
 
 
@@ -246,10 +613,100 @@ def _normalize_text(value: Any, *, field_name: str) -> str:
     return text
 
 
+def _sheet_entities_params(
+    sheet_id: str,
+    *,
+    entity_type: Optional[str],
+    limit: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "sheet_id": _normalize_text(sheet_id, field_name="sheet_id"),
+        "limit": int(limit),
+    }
+    if entity_type is not None:
+        params["entity_type"] = str(entity_type)
+    return params
+
+
+def _search_params(query: str, *, index: str, limit: int) -> Dict[str, Any]:
+    return {
+        "query": _normalize_text(query, field_name="query"),
+        "index": _normalize_text(index, field_name="index"),
+        "limit": int(limit),
+    }
+
+
+def _neighbors_params(
+    uuid: str,
+    *,
+    mode: str,
+    direction: str,
+    relationship_type: Optional[str],
+    radius: float,
+    limit: int,
+) -> Dict[str, Any]:
+    uuid = _normalize_text(uuid, field_name="uuid")
+    mode = _normalize_text(mode, field_name="mode").lower()
+    if mode not in _NEIGHBOR_MODES:
+        raise ValueError("mode must be one of: graph, spatial, both")
+    direction = _normalize_text(direction, field_name="direction").lower()
+    if direction not in _NEIGHBOR_DIRECTIONS:
+        raise ValueError("direction must be one of: in, out, both")
+    params: Dict[str, Any] = {
+        "uuid": uuid,
+        "mode": mode,
+        "direction": direction,
+        "radius": float(radius),
+        "limit": int(limit),
+    }
+    if relationship_type is not None:
+        params["relationship_type"] = str(relationship_type)
+    return params
+
+
+# Clauses that can change the graph. Matching is deliberately loose (it also hits
+# e.g. apoc.create.* procedure names or the words inside string literals): a false
+# positive only costs a cache clear.
+_CYPHER_WRITE_CLAUSE = re.compile(r"\b(?:CREATE|MERGE|SET|DELETE|REMOVE)\b", re.IGNORECASE)
+
+
+def _cypher_may_write(query: str) -> bool:
+    return _CYPHER_WRITE_CLAUSE.search(query) is not None
+
+
+def _cypher_body(
+    query: str,
+    *,
+    params: Optional[Dict[str, Any]],
+    max_rows: int,
+) -> Dict[str, Any]:
+    return {
+        "query": _normalize_text(query, field_name="query"),
+        "params": dict(params or {}),
+        "max_rows": int(max_rows),
+    }
+
+
 def _records(payload: DocQueryCypherResult) -> List[Dict[str, Any]]:
     return [row for row in payload.records if isinstance(row, dict)]
 
 
+def _resolve_output_path(output_text: str) -> Path:
+    # ".." is left for the OS to follow: collapsing it lexically (os.path.abspath)
+    # would write somewhere else when the path crosses a symlinked directory.
+    output_path = Path(output_text).expanduser()
+    if not output_path.is_absolute():
+        output_path = Path.cwd() / output_path
+    return output_path
+
+
+def _write_crop(output_text: str, png_bytes: bytes) -> Path:
+    output_path = _resolve_output_path(output_text)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(png_bytes)
+    return output_path
+
+
 def _parse_bbox_value(
     bbox: Union[str, List[Any], Tuple[Any, Any, Any, Any]],
 ) -> Tuple[float, float, float, float]:
@@ -257,19 +714,27 @@ def _parse_bbox_value(
         text = bbox.strip()
         if not text:
             raise ValueError("bbox is required")
-        parts = text.replace(",", " ").split()
+        parts: Sequence[Any] = text.replace(",", " ").split()
     elif isinstance(bbox, (list, tuple)):
-        parts = [str(item) for item in bbox]
+        parts = bbox
     else:
         raise ValueError("bbox must be a string or a list/tuple of four numbers")
 
     if len(parts) != 4:
         raise ValueError("bbox must contain four values: x1,y1,x2,y2")
     try:
-        x1, y1, x2, y2 = [float(value) for value in parts]
-    except ValueError as exc:
+        return float(parts[0]), float(parts[1]), float(parts[2]), float(parts[3])
+    except (TypeError, ValueError) as exc:
         raise ValueError("bbox values must be numeric") from exc
-    return x1, y1, x2, y2
+
+
+def _new_read_cache() -> _TTLMemo:
+    # Read caching is opt-in (DocQuery.cache_enable); a ttl of 0 keeps it disabled.
+    return _TTLMemo(maxsize=4096, ttl=0.0)
+
+
+def _read_cache_key(path: str, params: Dict[str, Any]) -> Hashable:
+    return (path, tuple(sorted(params.items())))
 
 
 # =============================================================================
@@ -280,9 +745,29 @@ def _parse_bbox_value(
 class Sheets:
     """Sheet ingestion and deletion API (sync)."""
 
-    def __init__(self, client: "BaseClient", project_id: str):
+    __slots__ = (
+        "_client",
+        "_project_id",
+        "_sheets_path",
+        "_cache_probe_skip_bytes",
+        "_cache_status",
+        "_read_cache",
+    )
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        project_id: str,
+        *,
+        cache_probe_skip_bytes: int = DEFAULT_CACHE_PROBE_SKIP_BYTES,
+        read_cache: Optional[_TTLMemo] = None,
+    ):
         self._client = client
         self._project_id = project_id
+        self._sheets_path = f"/projects/{project_id}/sheets"
+        self._cache_probe_skip_bytes = cache_probe_skip_bytes
+        self._cache_status = _TTLMemo()
+        self._read_cache = read_cache
 
     def add(
         self,
@@ -301,25 +786,24 @@ class Sheets:
         if file is not None and file_hash:
             raise ValueError("Provide either file or file_hash, not both")
 
-        if file is not None and file_hash is None:
+        if (
+            file is not None
+            and file_hash is None
+            and _should_probe_cache(file, self._cache_probe_skip_bytes)
+        ):
             computed_hash = _compute_file_hash(file)
-            cache = self._client.get(f"/drawings/cache/{computed_hash}")
-            if cache.get("cached"):
+            if self._is_cached(computed_hash):
                 file = None
                 file_hash = computed_hash
 
-        selector = _normalize_page_selector(page)
-        data: Dict[str, str] = {"page": selector}
-        if file_hash:
-            data["file_hash"] = file_hash
-        if source_description is not None:
-            data["source_description"] = source_description
-        if on_sheet_exists:
-            data["on_sheet_exists"] = on_sheet_exists
-        if community_update_mode:
-            data["community_update_mode"] = community_update_mode
-        if semantic_index_update_mode:
-            data["semantic_index_update_mode"] = semantic_index_update_mode
+        data = _build_sheet_data(
+            _normalize_page_selector(page),
+            file_hash=file_hash,
+            source_description=source_description,
+            on_sheet_exists=on_sheet_exists,
+            community_update_mode=community_update_mode,
+            semantic_index_update_mode=semantic_index_update_mode,
+        )
 
         upload = None
         handle = None
@@ -328,7 +812,7 @@ class Sheets:
                 upload, handle = _prepare_file(file)
 
             response = self._client.post(
-                f"/projects/{self._project_id}/sheets",
+                self._sheets_path,
                 files=upload,
                 data=data,
                 cast_to=SheetIngestResponse,
@@ -337,29 +821,96 @@ class Sheets:
             if handle is not None:
                 handle.close()
 
-        jobs = _jobs_from_response(self._client, self._project_id, response)
+        self._invalidate_reads()
+
+        jobs = _jobs_from_response(
+            self._client, self._project_id, response, read_cache=self._read_cache
+        )
         if len(jobs) == 1:
             return jobs[0]
         return JobBatch(jobs)
 
+    def add_many(
+        self,
+        files: Sequence[Uploadable],
+        *,
+        page: Union[int, str] = 1,
+        source_description: Optional[str] = None,
+        on_sheet_exists: Optional[str] = None,
+        community_update_mode: Optional[str] = None,
+        semantic_index_update_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = 8,
+    ) -> List[Union[Job, JobBatch]]:
+        """Queue ingestion for several files concurrently; results keep input order."""
+        options: Dict[str, Any] = {
+            "page": page,
+            "source_description": source_description,
+            "on_sheet_exists": on_sheet_exists,
+            "community_update_mode": community_update_mode,
+            "semantic_index_update_mode": semantic_index_update_mode,
+        }
+        results, errors = _map_threaded_until_error(
+            lambda file: self.add(file, **options),
+            list(files),
+            max_concurrency=max_concurrency,
+        )
+        _raise_for_ingest_errors(results, errors)
+        return cast(List[Union[Job, JobBatch]], results)
+
     def delete(self, sheet_id: str) -> SheetDeleteResult:
         """Delete a sheet and return cleanup stats."""
-        return self._client.delete(
-            f"/projects/{self._project_id}/sheets/{sheet_id}",
+        result = self._client.delete(
+            f"{self._sheets_path}/{sheet_id}",
             cast_to=SheetDeleteResult,
         )
+        self._invalidate_reads()
+        return result
+
+    def _invalidate_reads(self) -> None:
+        if self._read_cache is not None:
+            self._read_cache.clear()
+
+    def _is_cached(self, file_hash: str) -> bool:
+        # Only hits are memoized: a miss turns into a hit once the file has been uploaded.
+        if self._cache_status.get(file_hash):
+            return True
+        cache = self._client.get(f"/drawings/cache/{file_hash}")
+        cached = bool(cache.get("cached"))
+        if cached:
+            self._cache_status.set(file_hash, True)
+        return cached
 
     def job(self, job_id: str, *, page: Optional[int] = None) -> Job:
         """Construct a job handle for a known job id."""
-        return Job(self._client, self._project_id, job_id, page=page)
+        return Job(self._client, self._project_id, job_id, page=page, read_cache=self._read_cache)
 
 
 class AsyncSheets:
     """Sheet ingestion and deletion API (async)."""
 
-    def __init__(self, client: "AsyncBaseClient", project_id: str):
+    __slots__ = (
+        "_client",
+        "_project_id",
+        "_sheets_path",
+        "_cache_probe_skip_bytes",
+        "_cache_status",
+        "_read_cache",
+    )
+
+    def __init__(
+        self,
+        client: "AsyncBaseClient",
+        project_id: str,
+        *,
+        cache_probe_skip_bytes: int = DEFAULT_CACHE_PROBE_SKIP_BYTES,
+        read_cache: Optional[_TTLMemo] = None,
+    ):
         self._client = client
         self._project_id = project_id
+        self._sheets_path = f"/projects/{project_id}/sheets"
+        self._cache_probe_skip_bytes = cache_probe_skip_bytes
+        self._cache_status = _TTLMemo()
+        self._read_cache = read_cache
 
     async def add(
         self,
@@ -378,25 +929,24 @@ class AsyncSheets:
         if file is not None and file_hash:
             raise ValueError("Provide either file or file_hash, not both")
 
-        if file is not None and file_hash is None:
+        if (
+            file is not None
+            and file_hash is None
+            and _should_probe_cache(file, self._cache_probe_skip_bytes)
+        ):
             computed_hash = _compute_file_hash(file)
-            cache = await self._client.get(f"/drawings/cache/{computed_hash}")
-            if cache.get("cached"):
+            if await self._is_cached(computed_hash):
                 file = None
                 file_hash = computed_hash
 
-        selector = _normalize_page_selector(page)
-        data: Dict[str, str] = {"page": selector}
-        if file_hash:
-            data["file_hash"] = file_hash
-        if source_description is not None:
-            data["source_description"] = source_description
-        if on_sheet_exists:
-            data["on_sheet_exists"] = on_sheet_exists
-        if community_update_mode:
-            data["community_update_mode"] = community_update_mode
-        if semantic_index_update_mode:
-            data["semantic_index_update_mode"] = semantic_index_update_mode
+        data = _build_sheet_data(
+            _normalize_page_selector(page),
+            file_hash=file_hash,
+            source_description=source_description,
+            on_sheet_exists=on_sheet_exists,
+            community_update_mode=community_update_mode,
+            semantic_index_update_mode=semantic_index_update_mode,
+        )
 
         upload = None
         handle = None
@@ -404,7 +954,7 @@ class AsyncSheets:
             if file is not None:
                 upload, handle = _prepare_file(file)
             response = await self._client.post(
-                f"/projects/{self._project_id}/sheets",
+                self._sheets_path,
                 files=upload,
                 data=data,
                 cast_to=SheetIngestResponse,
@@ -413,21 +963,69 @@ class AsyncSheets:
             if handle is not None:
                 handle.close()
 
-        jobs = _async_jobs_from_response(self._client, self._project_id, response)
+        self._invalidate_reads()
+
+        jobs = _async_jobs_from_response(
+            self._client, self._project_id, response, read_cache=self._read_cache
+        )
         if len(jobs) == 1:
             return jobs[0]
         return AsyncJobBatch(jobs)
 
+    async def add_many(
+        self,
+        files: Sequence[Uploadable],
+        *,
+        page: Union[int, str] = 1,
+        source_description: Optional[str] = None,
+        on_sheet_exists: Optional[str] = None,
+        community_update_mode: Optional[str] = None,
+        semantic_index_update_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = 8,
+    ) -> List[Union[AsyncJob, AsyncJobBatch]]:
+        """Queue ingestion for several files concurrently; results keep input order."""
+        options: Dict[str, Any] = {
+            "page": page,
+            "source_description": source_description,
+            "on_sheet_exists": on_sheet_exists,
+            "community_update_mode": community_update_mode,
+            "semantic_index_update_mode": semantic_index_update_mode,
+        }
+        results, errors = await _gather_until_error(
+            [functools.partial(self.add, file, **options) for file in files],
+            max_concurrency=max_concurrency,
+        )
+        _raise_for_ingest_errors(results, errors)
+        return cast(List[Union[AsyncJob, AsyncJobBatch]], results)
+
     async def delete(self, sheet_id: str) -> SheetDeleteResult:
         """Delete a sheet and return cleanup stats."""
-        return await self._client.delete(
-            f"/projects/{self._project_id}/sheets/{sheet_id}",
+        result = await self._client.delete(
+            f"{self._sheets_path}/{sheet_id}",
             cast_to=SheetDeleteResult,
         )
+        self._invalidate_reads()
+        return result
+
+    def _invalidate_reads(self) -> None:
+        if self._read_cache is not None:
+            self._read_cache.clear()
+
+    async def _is_cached(self, file_hash: str) -> bool:
+        # Only hits are memoized: a miss turns into a hit once the file has been uploaded.
+        if self._cache_status.get(file_hash):
+            return True
+        cache = await self._client.get(f"/drawings/cache/{file_hash}")
+        cached = bool(cache.get("cached"))
+        if cached:
+            self._cache_status.set(file_hash, True)
+        return cached
 
     def job(self, job_id: str, *, page: Optional[int] = None) -> AsyncJob:
         """Construct a job handle for a known job id."""
-        return AsyncJob(self._client, self._project_id, job_id, page=page)
+        return AsyncJob(
+            self._client, self._project_id, job_id, page=page, read_cache=self._read_cache
+        )
 
 
 # =============================================================================
@@ -435,19 +1033,594 @@ class AsyncSheets:
 # =============================================================================
 
 
+# Each section runs as an uncorrelated CALL subquery that aggregates its own rows with
+# collect()/count() and no grouping key, so it yields exactly one row even when the
+# section is empty (a bare RETURN of zero rows would drop the whole outer row). The
+# statement therefore always yields one row in one round trip. Reachability is three
+# scalar counts (no per-node collect/UNWIND), and LOCATED_IN*1..2 is spelled out as
+# two fixed-length patterns so the planner never expands variable-length paths per node.
+_SHEET_SUMMARY_QUERY = (
+    "CALL { "
+    "  MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  WITH s LIMIT 1 "
+    "  RETURN collect({sheet_id: s.sheet_id, uuid: s.uuid, "
+    "                  name: coalesce(s.name, s.text)}) AS sheet_rows "
+    "} "
+    "CALL { "
+    "  MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  UNWIND labels(n) AS label "
+    "  WITH label WHERE label <> 'Entity' "
+    "  WITH label, count(*) AS count ORDER BY count DESC, label LIMIT $top_k_labels "
+    "  RETURN collect({label: label, count: count}) AS label_rows "
+    "} "
+    "CALL { "
+    "  MATCH ()-[r]->() "
+    "  WHERE r.project_id = $project_id "
+    "    AND $sheet_id IN coalesce(r.source_sheet_ids, []) "
+    "  WITH type(r) AS rel_type, count(*) AS count "
+    "  ORDER BY count DESC, rel_type LIMIT $top_k_rels "
+    "  RETURN collect({rel_type: rel_type, count: count}) AS rel_rows "
+    "} "
+    "CALL { "
+    "  MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  RETURN count(s) AS sheet_node_count "
+    "} "
+    "CALL { "
+    "  MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  WHERE NOT n:Sheet "
+    "  RETURN count(n) AS non_sheet_total "
+    "} "
+    "CALL { "
+    "  MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  WHERE NOT n:Sheet "
+    "    AND (EXISTS { "
+    "      MATCH (:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
+    "<-[:LOCATED_IN]-(n) "
+    "    } OR EXISTS { "
+    "      MATCH (:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
+    "<-[:LOCATED_IN]-()<-[:LOCATED_IN]-(n) "
+    "    }) "
+    "  RETURN count(n) AS reachable_non_sheet "
+    "} "
+    "CALL { "
+    "  MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
+    "  WHERE NOT n:Sheet "
+    "    AND NOT EXISTS { "
+    "      MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
+    "<-[:LOCATED_IN]-(n) "
+    "    } "
+    "    AND NOT EXISTS { "
+    "      MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
+    "<-[:LOCATED_IN]-()<-[:LOCATED_IN]-(n) "
+    "    } "
+    "  WITH n ORDER BY coalesce(n.name, n.text), n.uuid LIMIT $orphan_limit "
+    "  RETURN collect({uuid: n.uuid, "
+    "                  labels: [l IN labels(n) WHERE l <> 'Entity'], "
+    "                  category: n.category, "
+    "                  name: coalesce(n.name, n.text)}) AS orphan_rows "
+    "} "
+    "RETURN sheet_rows, label_rows, rel_rows, "
+    "       [{has_sheet_node: sheet_node_count > 0, sheet_node_count: sheet_node_count, "
+    "         non_sheet_total: non_sheet_total, "
+    "         reachable_non_sheet: reachable_non_sheet}] AS reachability_rows, "
+    "       orphan_rows"
+)
+
+# One page covers up to $limit sheet_id values from the entity inventory; Sheet nodes
+# are fetched for the same sheet_id window. page_end is null on the last page. Paging
+# compares toString(sheet_id) so integer and string ids share one cursor order. The
+# project-wide duplicate and missing-id checks only run on the first page. As in the
+# summary query, every subquery aggregates to exactly one row.
+_SHEET_LIST_QUERY = (
+    "CALL { "
+    "  MATCH (n:Entity {project_id:$project_id}) "
+    "  WHERE $after_sheet_id IS NULL OR toString(n.sheet_id) > $after_sheet_id "
+    "  WITH toString(n.sheet_id) AS sheet_id, count(n) AS entity_count "
+    "  ORDER BY sheet_id LIMIT $limit "
+    "  RETURN collect({sheet_id: sheet_id, entity_count: entity_count}) AS inventory "
+    "} "
+    "WITH inventory, "
+    "     CASE WHEN size(inventory) >= $limit THEN inventory[-1].sheet_id END AS page_end "
+    "CALL { "
+    "  WITH page_end "
+    "  MATCH (s:Entity:Sheet {project_id:$project_id}) "
+    "  WHERE ($after_sheet_id IS NULL OR toString(s.sheet_id) > $after_sheet_id) "
+    "    AND (page_end IS NULL OR toString(s.sheet_id) <= page_end) "
+    "  WITH s ORDER BY toString(s.sheet_id), s.uuid "
+    "  RETURN collect({sheet_id: s.sheet_id, uuid: s.uuid, "
+    "                  name: coalesce(s.name, s.text)}) AS sheet_nodes "
+    "} "
+    "CALL { "
+    "  UNWIND CASE WHEN $after_sheet_id IS NULL THEN [true] ELSE [] END AS first_page "
+    "  MATCH (s:Entity:Sheet {project_id:$project_id}) "
+    "  WITH s.sheet_id AS sheet_id, count(*) AS sheet_node_count "
+    "  WHERE sheet_node_count > 1 "
+    "  WITH sheet_id, sheet_node_count "
+    "  ORDER BY sheet_node_count DESC, sheet_id LIMIT 200 "
+    "  RETURN collect({sheet_id: sheet_id, sheet_node_count: sheet_node_count}) "
+    "         AS duplicate_sheet_nodes "
+    "} "
+    "CALL { "
+    "  UNWIND CASE WHEN $after_sheet_id IS NULL THEN [true] ELSE [] END AS first_page "
+    "  MATCH (n:Entity {project_id:$project_id}) "
+    "  WHERE n.sheet_id IS NULL OR trim(toString(n.sheet_id)) = '' "
+    "  RETURN count(n) AS missing_sheet_id_count "
+    "} "
+    "RETURN sheet_nodes, inventory, duplicate_sheet_nodes, missing_sheet_id_count, "
+    "       page_end AS next_after_sheet_id"
+)
+
+
+def _sheet_summary_inputs(
+    project_id: str,
+    sheet_id: str,
+    *,
+    orphan_limit: int,
+    top_k_labels: int,
+    top_k_rels: int,
+) -> Dict[str, Any]:
+    return {
+        "project_id": project_id,
+        "sheet_id": _normalize_text(sheet_id, field_name="sheet_id"),
+        "orphan_limit": max(1, min(int(orphan_limit), 200)),
+        "top_k_labels": max(1, min(int(top_k_labels), 500)),
+        "top_k_rels": max(1, min(int(top_k_rels), 500)),
+    }
+
+
+def _sheet_list_inputs(
+    project_id: str,
+    *,
+    after_sheet_id: Optional[str],
+    limit: int,
+) -> Dict[str, Any]:
+    return {
+        "project_id": project_id,
+        "after_sheet_id": (
+            None
+            if after_sheet_id is None
+            else _normalize_text(after_sheet_id, field_name="after_sheet_id")
+        ),
+        "limit": max(1, min(int(limit), 5000)),
+    }
+
+
+def _section(row: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    value = row.get(key)
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def _sheet_summary_result(
+    inputs: Dict[str, Any],
+    payload: DocQueryCypherResult,
+) -> DocQuerySheetSummaryResult:
+    sheet_id = inputs["sheet_id"]
+    rows = _records(payload)
+    row = rows[0] if rows else {}
+    sheet_rows = _section(row, "sheet_rows")
+    reachability_rows = _section(row, "reachability_rows")
+
+    reachability: Dict[str, Any] = {
+        "has_sheet_node": False,
+        "sheet_node_count": 0,
+        "non_sheet_total": 0,
+        "reachable_non_sheet": 0,
+        "unreachable_non_sheet": 0,
+    }
+    if reachability_rows:
+        first = reachability_rows[0]
+        has_sheet_node = bool(first.get("has_sheet_node"))
+        sheet_node_count = int(first.get("sheet_node_count") or 0)
+        non_sheet_total = int(first.get("non_sheet_total") or 0)
+        reachable_non_sheet = int(first.get("reachable_non_sheet") or 0)
+        reachability = {
+            "has_sheet_node": has_sheet_node,
+            "sheet_node_count": sheet_node_count,
+            "non_sheet_total": non_sheet_total,
+            "reachable_non_sheet": reachable_non_sheet,
+            "unreachable_non_sheet": max(0, non_sheet_total - reachable_non_sheet),
+        }
+
+    warnings: List[Dict[str, Any]] = []
+    if not reachability["has_sheet_node"]:
+        warnings.append(
+            {
+                "type": "missing_sheet_node",
+                "message": f"No :Entity:Sheet node found for sheet_id={sheet_id}.",
+            }
+        )
+    if reachability["sheet_node_count"] > 1:
+        warnings.append(
+            {
+                "type": "duplicate_sheet_nodes",
+                "message": (
+                    f"Found {reachability['sheet_node_count']} Sheet nodes for "
+                    f"sheet_id={sheet_id}; expected 1."
+                ),
+            }
+        )
+    if reachability["unreachable_non_sheet"] > 0:
+        warnings.append(
+            {
+                "type": "unreachable_entities",
+                "message": (
+                    f"{reachability['unreachable_non_sheet']} non-sheet entities "
+                    "are not reachable "
+                    f"from sheet {sheet_id} via LOCATED_IN*1..2."
+                ),
+            }
+        )
+
+    # The result is assembled here from already-decoded rows; skip re-validation.
+    return DocQuerySheetSummaryResult.model_construct(
+        ok=True,
+        command="sheet-summary",
+        input=inputs,
+        sheet_node=(sheet_rows[0] if sheet_rows else None),
+        node_label_counts=_section(row, "label_rows"),
+        relationship_counts=_section(row, "rel_rows"),
+        reachability=reachability,
+        orphan_examples=_section(row, "orphan_rows"),
+        warnings=warnings,
+    )
+
+
+def _sheet_list_result(
+    inputs: Dict[str, Any],
+    payload: DocQueryCypherResult,
+) -> DocQuerySheetListResult:
+    rows = _records(payload)
+    row = rows[0] if rows else {}
+    sheet_nodes = _section(row, "sheet_nodes")
+    inventory = _section(row, "inventory")
+    duplicate_sheet_nodes = _section(row, "duplicate_sheet_nodes")
+    missing_sheet_id_count = int(row.get("missing_sheet_id_count") or 0)
+    next_after_sheet_id = row.get("next_after_sheet_id")
+
+    sheet_node_ids = {str(r["sheet_id"]) for r in sheet_nodes if r.get("sheet_id")}
+    inventory_counts: Dict[str, int] = {}
+    total_entities = 0
+    for r in inventory:
+        count = int(r.get("entity_count") or 0)
+        total_entities += count
+        if r.get("sheet_id"):
+            inventory_counts[str(r["sheet_id"])] = count
+    inventory_ids = inventory_counts.keys()
+    inventory_without_sheet_node = sorted(inventory_ids - sheet_node_ids)
+    sheet_nodes_without_inventory = sorted(sheet_node_ids - inventory_ids)
+    sheet_nodes_with_only_self = sorted(
+        sid for sid in sheet_node_ids if inventory_counts.get(sid, 0) == 1
+    )
+
+    mismatch_warnings: List[Dict[str, Any]] = []
+    if inventory_without_sheet_node:
+        mismatch_warnings.append(
+            {
+                "type": "inventory_sheet_id_without_sheet_node",
+                "sheet_ids": inventory_without_sheet_node,
+                "message": "Entities exist for sheet_id values that do not have a Sheet node.",
+            }
+        )
+    if sheet_nodes_without_inventory:
+        mismatch_warnings.append(
+            {
+                "type": "sheet_node_without_inventory",
+                "sheet_ids": sheet_nodes_without_inventory,
+                "message": "Sheet nodes exist with no matching entity inventory rows.",
+            }
+        )
+    if duplicate_sheet_nodes:
+        mismatch_warnings.append(
+            {
+                "type": "duplicate_sheet_nodes",
+                "duplicates": duplicate_sheet_nodes,
+                "message": "Multiple Sheet nodes found for one or more sheet_id values.",
+            }
+        )
+    if missing_sheet_id_count > 0:
+        mismatch_warnings.append(
+            {
+                "type": "entities_missing_sheet_id",
+                "count": missing_sheet_id_count,
+                "message": "Some entities are missing sheet_id.",
+            }
+        )
+    if sheet_nodes_with_only_self:
+        mismatch_warnings.append(
+            {
+                "type": "sheet_nodes_without_non_sheet_entities",
+                "sheet_ids": sheet_nodes_with_only_self,
+                "message": "Sheet IDs where inventory count is only the Sheet node itself.",
+            }
+        )
+
+    return DocQuerySheetListResult.model_construct(
+        ok=True,
+        command="sheet-list",
+        input=inputs,
+        sheet_nodes=sheet_nodes,
+        entity_sheet_inventory=inventory,
+        totals={
+            "sheet_node_count": len(sheet_nodes),
+            "inventory_sheet_id_count": len(inventory_ids),
+            "total_entities": total_entities,
+            "missing_sheet_id_count": missing_sheet_id_count,
+        },
+        mismatch_warnings=mismatch_warnings,
+        next_after_sheet_id=None if next_after_sheet_id is None else str(next_after_sheet_id),
+    )
+
+
+# The source columns repeat on every row; OPTIONAL MATCH guarantees at least one row
+# whenever the source node exists, so an empty result means "not found". DISTINCT
+# drops the duplicate rows that parallel LOCATED_IN edges would otherwise produce.
+_REFERENCE_RESOLVE_QUERY = (
+    "MATCH (src:Entity {project_id:$project_id, uuid:$uuid}) "
+    "WITH src LIMIT 1 "
+    "OPTIONAL MATCH (src)-[r:REFERENCES]->(t:Entity {project_id:$project_id}) "
+    "OPTIONAL MATCH (t)-[:LOCATED_IN]->(loc1:Entity {project_id:$project_id}) "
+    "OPTIONAL MATCH (loc1)-[:LOCATED_IN]->(loc2:Entity {project_id:$project_id}) "
+    "RETURN DISTINCT src.uuid AS source_uuid, "
+    "       [l IN labels(src) WHERE l <> 'Entity'] AS source_labels, "
+    "       src.sheet_id AS source_sheet_id, "
+    "       src.detail_id AS source_detail_id, "
+    "       src.section_id AS source_section_id, "
+    "       src.target_sheets AS source_target_sheets, "
+    "       src.category AS source_category, "
+    "       coalesce(src.name, src.text) AS source_name, "
+    "       src.text AS source_text, "
+    "       r.rel_uuid AS rel_uuid, "
+    "       r.fact AS fact, "
+    "       r.source_sheet_ids AS source_sheet_ids, "
+    "       r.meta_target_sheet AS meta_target_sheet, "
+    "       r.meta_target_detail_id AS meta_target_detail_id, "
+    "       r.meta_target_section_id AS meta_target_section_id, "
+    "       r.meta_target_kind AS meta_target_kind, "
+    "       t.uuid AS target_uuid, "
+    "       [l IN labels(t) WHERE l <> 'Entity'] AS target_labels, "
+    "       t.sheet_id AS target_sheet_id, "
+    "       t.detail_id AS target_detail_id, "
+    "       t.section_id AS target_section_id, "
+    "       t.category AS target_category, "
+    "       coalesce(t.name, t.text) AS target_name, "
+    "       loc1.uuid AS target_located_in_uuid_1, "
+    "       [l IN labels(loc1) WHERE l <> 'Entity'] AS target_located_in_labels_1, "
+    "       coalesce(loc1.name, loc1.text) AS target_located_in_name_1, "
+    "       loc2.uuid AS target_located_in_uuid_2, "
+    "       [l IN labels(loc2) WHERE l <> 'Entity'] AS target_located_in_labels_2, "
+    "       coalesce(loc2.name, loc2.text) AS target_located_in_name_2 "
+    "ORDER BY coalesce(target_sheet_id, ''), coalesce(target_name, ''), target_uuid "
+    "LIMIT $limit"
+)
+
+_REFERENCE_SOURCE_FIELDS = (
+    "uuid",
+    "labels",
+    "sheet_id",
+    "detail_id",
+    "section_id",
+    "target_sheets",
+    "category",
+    "name",
+    "text",
+)
+
+
+def _reference_resolve_result(
+    project_id: str,
+    node_uuid: str,
+    limit: int,
+    payload: DocQueryCypherResult,
+) -> DocQueryReferenceResolveResult:
+    reference_rows = _records(payload)
+    if not reference_rows:
+        return DocQueryReferenceResolveResult.model_construct(
+            ok=True,
+            command="reference-resolve",
+            input={
+                "project_id": project_id,
+                "uuid": node_uuid,
+                "limit": limit,
+            },
+            found=False,
+            source=None,
+            resolved_references=[],
+            warnings=[{"type": "source_not_found", "message": "No source node found for uuid."}],
+        )
+
+    first = reference_rows[0]
+    source = {field: first.get(f"source_{field}") for field in _REFERENCE_SOURCE_FIELDS}
+    source_labels = source.get("labels") if isinstance(source.get("labels"), list) else []
+    source_target_sheets = source.get("target_sheets")
+    if not isinstance(source_target_sheets, list):
+        source_target_sheets = []
+    source_target_sheet_ids = {str(sid) for sid in source_target_sheets}
+
+    resolved_references: List[Dict[str, Any]] = []
+    warnings: List[Dict[str, Any]] = []
+
+    for row in reference_rows:
+        rel_uuid = row.get("rel_uuid")
+        target_uuid = row.get("target_uuid")
+        if rel_uuid is None and target_uuid is None:
+            continue
+
+        target_sheet_id = row.get("target_sheet_id")
+        meta_target_sheet = row.get("meta_target_sheet")
+        sheet_match_meta = None
+        if target_sheet_id is not None and meta_target_sheet is not None:
+            sheet_match_meta = str(target_sheet_id) == str(meta_target_sheet)
+
+        sheet_in_source_targets = None
+        if target_sheet_id is not None and source_target_sheet_ids:
+            sheet_in_source_targets = str(target_sheet_id) in source_target_sheet_ids
+
+        traversal_path: List[Dict[str, Any]] = [
+            {"from_uuid": node_uuid, "rel_type": "REFERENCES", "to_uuid": target_uuid},
+        ]
+        if row.get("target_located_in_uuid_1"):
+            traversal_path.append(
+                {
+                    "from_uuid": target_uuid,
+                    "rel_type": "LOCATED_IN",
+                    "to_uuid": row.get("target_located_in_uuid_1"),
+                }
+            )
+        if row.get("target_located_in_uuid_2"):
+            traversal_path.append(
+                {
+                    "from_uuid": row.get("target_located_in_uuid_1"),
+                    "rel_type": "LOCATED_IN",
+                    "to_uuid": row.get("target_located_in_uuid_2"),
+                }
+            )
+
+        resolved_references.append(
+            {
+                "relationship": {
+                    "rel_uuid": rel_uuid,
+                    "fact": row.get("fact"),
+                    "source_sheet_ids": row.get("source_sheet_ids"),
+                    "meta_target_sheet": meta_target_sheet,
+                    "meta_target_detail_id": row.get("meta_target_detail_id"),
+                    "meta_target_section_id": row.get("meta_target_section_id"),
+                    "meta_target_kind": row.get("meta_target_kind"),
+                },
+                "target": {
+                    "uuid": target_uuid,
+                    "labels": row.get("target_labels"),
+                    "sheet_id": target_sheet_id,
+                    "detail_id": row.get("target_detail_id"),
+                    "section_id": row.get("target_section_id"),
+                    "category": row.get("target_category"),
+                    "name": row.get("target_name"),
+                },
+                "target_context": {
+                    "located_in_1": {
+                        "uuid": row.get("target_located_in_uuid_1"),
+                        "labels": row.get("target_located_in_labels_1"),
+                        "name": row.get("target_located_in_name_1"),
+                    },
+                    "located_in_2": {
+                        "uuid": row.get("target_located_in_uuid_2"),
+                        "labels": row.get("target_located_in_labels_2"),
+                        "name": row.get("target_located_in_name_2"),
+                    },
+                },
+                "checks": {
+                    "target_sheet_matches_meta_target_sheet": sheet_match_meta,
+                    "target_sheet_in_source_target_sheets": sheet_in_source_targets,
+                },
+                "traversal_path": traversal_path,
+            }
+        )
+
+        if sheet_match_meta is False:
+            warnings.append(
+                {
+                    "type": "meta_target_sheet_mismatch",
+                    "rel_uuid": rel_uuid,
+                    "message": "Target sheet_id does not match relationship meta_target_sheet.",
+                }
+            )
+        if sheet_in_source_targets is False:
+            warnings.append(
+                {
+                    "type": "source_target_sheets_mismatch",
+                    "rel_uuid": rel_uuid,
+                    "message": "Target sheet_id is not listed in source target_sheets.",
+                }
+            )
+
+    if "Callout" not in source_labels:
+        warnings.append(
+            {
+                "type": "source_not_callout",
+                "message": "Source node is not labeled Callout; references may still exist.",
+            }
+        )
+    if not resolved_references:
+        warnings.append(
+            {
+                "type": "no_outgoing_references",
+                "message": "No outgoing REFERENCES edges found for this source node.",
+            }
+        )
+
+    return DocQueryReferenceResolveResult.model_construct(
+        ok=True,
+        command="reference-resolve",
+        input={"project_id": project_id, "uuid": node_uuid, "limit": limit},
+        found=True,
+        source=source,
+        resolved_references=resolved_references,
+        count=len(resolved_references),
+        warnings=warnings,
+    )
+
+
 class DocQuery:
-    """DocQuery traversal API (sync)."""
+    """DocQuery traversal API (sync).
+
+    After ``cache_enable(ttl)``, ``node_get``, ``sheet_entities``, ``search``,
+    ``neighbors``, ``sheet_summary`` and ``sheet_list`` results are cached for ``ttl``
+    seconds and returned as copies. Sheet uploads, deletes and completed jobs from the
+    same project handle, and ``cypher`` statements with a write clause, clear the
+    cache; writes made elsewhere show up once entries expire.
+    """
 
-    def __init__(self, client: "BaseClient", project_id: str):
+    __slots__ = ("_client", "_project_id", "_read_cache")
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        project_id: str,
+        *,
+        read_cache: Optional[_TTLMemo] = None,
+    ):
         self._client = client
         self._project_id = project_id
+        self._read_cache = read_cache if read_cache is not None else _new_read_cache()
+
+    def _memoized(self, key: Hashable, fetch: Callable[[], _ModelT]) -> _ModelT:
+        memo = self._read_cache
+        if not memo.enabled:
+            return fetch()
+        cached: Optional[_ModelT] = memo.get(key)
+        if cached is None:
+            cached = fetch()
+            memo.set(key, cached)
+        # Hand out copies so a caller mutating its result cannot alter the cached one.
+        return cached.model_copy(deep=True)
+
+    def _cached_get(self, path: str, params: Dict[str, Any], cast_to: Type[_ModelT]) -> _ModelT:
+        def fetch() -> _ModelT:
+            return cast(_ModelT, self._client.get(path, params=params, cast_to=cast_to))
+
+        return self._memoized(_read_cache_key(path, params), fetch)
+
+    def cache_enable(self, ttl: float = 60.0, *, maxsize: int = 4096) -> None:
+        """Cache read results for ``ttl`` seconds; ``ttl=0`` turns caching off again."""
+        self._read_cache.clear()
+        self._read_cache.ttl = ttl
+        self._read_cache.maxsize = maxsize
+
+    def cache_clear(self) -> None:
+        """Drop all cached read results."""
+        self._read_cache.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return read-cache hit/miss counters and current size."""
+        return self._read_cache.info()
 
     def node_get(self, uuid: str) -> DocQueryNodeGetResult:
         uuid = _normalize_text(uuid, field_name="uuid")
-        return self._client.get(
+        return self._cached_get(
             f"/projects/{self._project_id}/node-get",
-            params={"uuid": uuid},
-            cast_to=DocQueryNodeGetResult,
+            {"uuid": uuid},
+            DocQueryNodeGetResult,
         )
 
     def sheet_entities(
@@ -457,14 +1630,10 @@ class DocQuery:
         entity_type: Optional[str] = None,
         limit: int = 200,
     ) -> DocQuerySheetEntitiesResult:
-        sheet_id = _normalize_text(sheet_id, field_name="sheet_id")
-        params: Dict[str, Any] = {"sheet_id": sheet_id, "limit": int(limit)}
-        if entity_type is not None:
-            params["entity_type"] = str(entity_type)
-        return self._client.get(
+        return self._cached_get(
             f"/projects/{self._project_id}/sheet-entities",
-            params=params,
-            cast_to=DocQuerySheetEntitiesResult,
+            _sheet_entities_params(sheet_id, entity_type=entity_type, limit=limit),
+            DocQuerySheetEntitiesResult,
         )
 
     def search(
@@ -474,12 +1643,10 @@ class DocQuery:
         index: str = "entity_search",
         limit: int = 20,
     ) -> DocQuerySearchResult:
-        query = _normalize_text(query, field_name="query")
-        index = _normalize_text(index, field_name="index")
-        return self._client.get(
+        return self._cached_get(
             f"/projects/{self._project_id}/search",
-            params={"query": query, "index": index, "limit": int(limit)},
-            cast_to=DocQuerySearchResult,
+            _search_params(query, index=index, limit=limit),
+            DocQuerySearchResult,
         )
 
     def neighbors(
@@ -492,26 +1659,18 @@ class DocQuery:
         radius: float = 200.0,
         limit: int = 50,
     ) -> DocQueryNeighborsResult:
-        uuid = _normalize_text(uuid, field_name="uuid")
-        mode = _normalize_text(mode, field_name="mode").lower()
-        if mode not in {"graph", "spatial", "both"}:
-            raise ValueError("mode must be one of: graph, spatial, both")
-        direction = _normalize_text(direction, field_name="direction").lower()
-        if direction not in {"in", "out", "both"}:
-            raise ValueError("direction must be one of: in, out, both")
-        params: Dict[str, Any] = {
-            "uuid": uuid,
-            "mode": mode,
-            "direction": direction,
-            "radius": float(radius),
-            "limit": int(limit),
-        }
-        if relationship_type is not None:
-            params["relationship_type"] = str(relationship_type)
-        return self._client.get(
+        params = _neighbors_params(
+            uuid,
+            mode=mode,
+            direction=direction,
+            relationship_type=relationship_type,
+            radius=radius,
+            limit=limit,
+        )
+        return self._cached_get(
             f"/projects/{self._project_id}/neighbors",
-            params=params,
-            cast_to=DocQueryNeighborsResult,
+            params,
+            DocQueryNeighborsResult,
         )
 
     def cypher(
@@ -521,480 +1680,90 @@ class DocQuery:
         params: Optional[Dict[str, Any]] = None,
         max_rows: int = 500,
     ) -> DocQueryCypherResult:
-        query = _normalize_text(query, field_name="query")
-        body: Dict[str, Any] = {
-            "query": query,
-            "params": dict(params or {}),
-            "max_rows": int(max_rows),
-        }
+        """Run a raw Cypher statement.
+
+        Statements containing CREATE, MERGE, SET, DELETE or REMOVE clear the read
+        cache; call ``cache_clear()`` after writes this check cannot see.
+        """
+        result = self._run_cypher(query, params=params, max_rows=max_rows)
+        if _cypher_may_write(query):
+            self._read_cache.clear()
+        return result
+
+    def _run_cypher(
+        self,
+        query: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        max_rows: int,
+    ) -> DocQueryCypherResult:
         return self._client.post(
             f"/projects/{self._project_id}/cypher",
-            json=body,
+            json=_cypher_body(query, params=params, max_rows=max_rows),
             cast_to=DocQueryCypherResult,
         )
 
-    def sheet_summary(self, sheet_id: str, *, orphan_limit: int = 10) -> DocQuerySheetSummaryResult:
-        sheet_id = _normalize_text(sheet_id, field_name="sheet_id")
-        safe_orphan_limit = max(1, min(int(orphan_limit), 200))
-
-        sheet_node_payload = self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
-            "RETURN s.sheet_id AS sheet_id, s.uuid AS uuid, "
-            "coalesce(s.name, s.text) AS name LIMIT 1",
-            params={"sheet_id": sheet_id},
-            max_rows=1,
-        )
-        label_counts_payload = self.cypher(
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "UNWIND labels(n) AS label "
-            "WITH label WHERE label <> 'Entity' "
-            "RETURN label, count(*) AS count ORDER BY count DESC, label",
-            params={"sheet_id": sheet_id},
-            max_rows=500,
-        )
-        rel_counts_payload = self.cypher(
-            "MATCH ()-[r]->() "
-            "WHERE r.project_id = $project_id "
-            "  AND $sheet_id IN coalesce(r.source_sheet_ids, []) "
-            "RETURN type(r) AS rel_type, count(*) AS count "
-            "ORDER BY count DESC, rel_type",
-            params={"sheet_id": sheet_id},
-            max_rows=500,
-        )
-        reachability_payload = self.cypher(
-            "OPTIONAL MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "WITH s, collect(n) AS nodes "
-            "UNWIND nodes AS n "
-            "WITH s, n, n:Sheet AS is_sheet "
-            "RETURN "
-            "(s IS NOT NULL) AS has_sheet_node, "
-            "count(CASE WHEN is_sheet THEN 1 END) AS sheet_node_count, "
-            "count(CASE WHEN NOT is_sheet THEN 1 END) AS non_sheet_total, "
-            "count(CASE WHEN NOT is_sheet AND s IS NOT NULL "
-            "           AND EXISTS { MATCH (s)<-[:LOCATED_IN*1..2]-(n) } "
-            "      THEN 1 END) AS reachable_non_sheet",
-            params={"sheet_id": sheet_id},
-            max_rows=1,
-        )
-        orphan_payload = self.cypher(
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "WHERE NOT n:Sheet "
-            "  AND NOT EXISTS { "
-            "    MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
-            "<-[:LOCATED_IN*1..2]-(n) "
-            "  } "
-            "RETURN n.uuid AS uuid, "
-            "       [l IN labels(n) WHERE l <> 'Entity'] AS labels, "
-            "       n.category AS category, "
-            "       coalesce(n.name, n.text) AS name "
-            "ORDER BY coalesce(n.name, n.text), n.uuid "
-            "LIMIT $orphan_limit",
-            params={"sheet_id": sheet_id, "orphan_limit": safe_orphan_limit},
-            max_rows=safe_orphan_limit,
+    def sheet_summary(
+        self,
+        sheet_id: str,
+        *,
+        orphan_limit: int = 10,
+        top_k_labels: int = 500,
+        top_k_rels: int = 500,
+    ) -> DocQuerySheetSummaryResult:
+        inputs = _sheet_summary_inputs(
+            self._project_id,
+            sheet_id,
+            orphan_limit=orphan_limit,
+            top_k_labels=top_k_labels,
+            top_k_rels=top_k_rels,
         )
 
-        sheet_rows = _records(sheet_node_payload)
-        label_rows = _records(label_counts_payload)
-        rel_rows = _records(rel_counts_payload)
-        reachability_rows = _records(reachability_payload)
-        orphan_rows = _records(orphan_payload)
-
-        reachability: Dict[str, Any] = {
-            "has_sheet_node": False,
-            "sheet_node_count": 0,
-            "non_sheet_total": 0,
-            "reachable_non_sheet": 0,
-            "unreachable_non_sheet": 0,
-        }
-        if reachability_rows:
-            first = reachability_rows[0]
-            has_sheet_node = bool(first.get("has_sheet_node"))
-            sheet_node_count = int(first.get("sheet_node_count") or 0)
-            non_sheet_total = int(first.get("non_sheet_total") or 0)
-            reachable_non_sheet = int(first.get("reachable_non_sheet") or 0)
-            reachability = {
-                "has_sheet_node": has_sheet_node,
-                "sheet_node_count": sheet_node_count,
-                "non_sheet_total": non_sheet_total,
-                "reachable_non_sheet": reachable_non_sheet,
-                "unreachable_non_sheet": max(0, non_sheet_total - reachable_non_sheet),
-            }
-
-        warnings: List[Dict[str, Any]] = []
-        if not reachability["has_sheet_node"]:
-            warnings.append(
-                {
-                    "type": "missing_sheet_node",
-                    "message": f"No :Entity:Sheet node found for sheet_id={sheet_id}.",
-                }
-            )
-        if reachability["sheet_node_count"] > 1:
-            warnings.append(
-                {
-                    "type": "duplicate_sheet_nodes",
-                    "message": (
-                        f"Found {reachability['sheet_node_count']} Sheet nodes for "
-                        f"sheet_id={sheet_id}; expected 1."
-                    ),
-                }
+        def fetch() -> DocQuerySheetSummaryResult:
+            payload = self._run_cypher(
+                _SHEET_SUMMARY_QUERY,
+                params={k: v for k, v in inputs.items() if k != "project_id"},
+                max_rows=1,
             )
-        if reachability["unreachable_non_sheet"] > 0:
-            warnings.append(
-                {
-                    "type": "unreachable_entities",
-                    "message": (
-                        f"{reachability['unreachable_non_sheet']} non-sheet entities "
-                        "are not reachable "
-                        f"from sheet {sheet_id} via LOCATED_IN*1..2."
-                    ),
-                }
-            )
-
-        return DocQuerySheetSummaryResult.model_validate(
-            {
-                "ok": True,
-                "command": "sheet-summary",
-                "input": {
-                    "project_id": self._project_id,
-                    "sheet_id": sheet_id,
-                    "orphan_limit": safe_orphan_limit,
-                },
-                "sheet_node": (sheet_rows[0] if sheet_rows else None),
-                "node_label_counts": label_rows,
-                "relationship_counts": rel_rows,
-                "reachability": reachability,
-                "orphan_examples": orphan_rows,
-                "warnings": warnings,
-            }
-        )
-
-    def sheet_list(self) -> DocQuerySheetListResult:
-        sheet_nodes_payload = self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id}) "
-            "RETURN s.sheet_id AS sheet_id, s.uuid AS uuid, coalesce(s.name, s.text) AS name "
-            "ORDER BY s.sheet_id, s.uuid",
-            max_rows=5000,
-        )
-        inventory_payload = self.cypher(
-            "MATCH (n:Entity {project_id:$project_id}) "
-            "RETURN n.sheet_id AS sheet_id, count(n) AS entity_count "
-            "ORDER BY n.sheet_id",
-            max_rows=5000,
-        )
-        duplicate_sheet_nodes_payload = self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id}) "
-            "WITH s.sheet_id AS sheet_id, count(*) AS sheet_node_count "
-            "WHERE sheet_node_count > 1 "
-            "RETURN sheet_id, sheet_node_count "
-            "ORDER BY sheet_node_count DESC, sheet_id",
-            max_rows=200,
-        )
-        missing_sheet_id_payload = self.cypher(
-            "MATCH (n:Entity {project_id:$project_id}) "
-            "WHERE n.sheet_id IS NULL OR trim(toString(n.sheet_id)) = '' "
-            "RETURN count(n) AS missing_sheet_id_count",
-            max_rows=1,
-        )
+            return _sheet_summary_result(inputs, payload)
 
-        sheet_nodes = _records(sheet_nodes_payload)
-        inventory = _records(inventory_payload)
-        duplicate_sheet_nodes = _records(duplicate_sheet_nodes_payload)
-        missing_sheet_rows = _records(missing_sheet_id_payload)
-        missing_sheet_id_count = (
-            int(missing_sheet_rows[0].get("missing_sheet_id_count") or 0)
-            if missing_sheet_rows
-            else 0
-        )
+        return self._memoized(_read_cache_key("sheet-summary", inputs), fetch)
 
-        sheet_node_ids = {str(r["sheet_id"]) for r in sheet_nodes if r.get("sheet_id")}
-        inventory_ids = {str(r["sheet_id"]) for r in inventory if r.get("sheet_id")}
-        inventory_counts: Dict[str, int] = {
-            str(r["sheet_id"]): int(r.get("entity_count") or 0)
-            for r in inventory
-            if r.get("sheet_id")
-        }
-        total_entities = sum(int(r.get("entity_count") or 0) for r in inventory)
-        inventory_without_sheet_node = sorted(inventory_ids - sheet_node_ids)
-        sheet_nodes_without_inventory = sorted(sheet_node_ids - inventory_ids)
-        sheet_nodes_with_only_self = sorted(
-            sid for sid in sheet_node_ids if inventory_counts.get(sid, 0) == 1
-        )
-
-        mismatch_warnings: List[Dict[str, Any]] = []
-        if inventory_without_sheet_node:
-            mismatch_warnings.append(
-                {
-                    "type": "inventory_sheet_id_without_sheet_node",
-                    "sheet_ids": inventory_without_sheet_node,
-                    "message": "Entities exist for sheet_id values that do not have a Sheet node.",
-                }
-            )
-        if sheet_nodes_without_inventory:
-            mismatch_warnings.append(
-                {
-                    "type": "sheet_node_without_inventory",
-                    "sheet_ids": sheet_nodes_without_inventory,
-                    "message": "Sheet nodes exist with no matching entity inventory rows.",
-                }
-            )
-        if duplicate_sheet_nodes:
-            mismatch_warnings.append(
-                {
-                    "type": "duplicate_sheet_nodes",
-                    "duplicates": duplicate_sheet_nodes,
-                    "message": "Multiple Sheet nodes found for one or more sheet_id values.",
-                }
-            )
-        if missing_sheet_id_count > 0:
-            mismatch_warnings.append(
-                {
-                    "type": "entities_missing_sheet_id",
-                    "count": missing_sheet_id_count,
-                    "message": "Some entities are missing sheet_id.",
-                }
-            )
-        if sheet_nodes_with_only_self:
-            mismatch_warnings.append(
-                {
-                    "type": "sheet_nodes_without_non_sheet_entities",
-                    "sheet_ids": sheet_nodes_with_only_self,
-                    "message": "Sheet IDs where inventory count is only the Sheet node itself.",
-                }
+    def sheet_list(
+        self,
+        *,
+        after_sheet_id: Optional[str] = None,
+        limit: int = 5000,
+    ) -> DocQuerySheetListResult:
+        """List sheets in pages of up to ``limit`` sheet_id values.
+
+        Pass the previous result's ``next_after_sheet_id`` as ``after_sheet_id`` to
+        fetch the next page; it is ``None`` once the last page has been returned.
+        sheet_ids are paged in string order. Project-wide duplicate Sheet node and
+        missing sheet_id checks are only reported on the first page.
+        """
+        inputs = _sheet_list_inputs(self._project_id, after_sheet_id=after_sheet_id, limit=limit)
+
+        def fetch() -> DocQuerySheetListResult:
+            payload = self._run_cypher(
+                _SHEET_LIST_QUERY,
+                params={k: v for k, v in inputs.items() if k != "project_id"},
+                max_rows=1,
             )
+            return _sheet_list_result(inputs, payload)
 
-        return DocQuerySheetListResult.model_validate(
-            {
-                "ok": True,
-                "command": "sheet-list",
-                "input": {
-                    "project_id": self._project_id,
-                },
-                "sheet_nodes": sheet_nodes,
-                "entity_sheet_inventory": inventory,
-                "totals": {
-                    "sheet_node_count": len(sheet_nodes),
-                    "inventory_sheet_id_count": len(inventory_ids),
-                    "total_entities": total_entities,
-                    "missing_sheet_id_count": missing_sheet_id_count,
-                },
-                "mismatch_warnings": mismatch_warnings,
-            }
-        )
+        return self._memoized(_read_cache_key("sheet-list", inputs), fetch)
 
     def reference_resolve(self, uuid: str, *, limit: int = 100) -> DocQueryReferenceResolveResult:
         node_uuid = _normalize_text(uuid, field_name="uuid")
         safe_limit = max(1, min(int(limit), 200))
 
-        source_payload = self.cypher(
-            "MATCH (src:Entity {project_id:$project_id, uuid:$uuid}) "
-            "RETURN src.uuid AS uuid, "
-            "       [l IN labels(src) WHERE l <> 'Entity'] AS labels, "
-            "       src.sheet_id AS sheet_id, "
-            "       src.detail_id AS detail_id, "
-            "       src.section_id AS section_id, "
-            "       src.target_sheets AS target_sheets, "
-            "       src.category AS category, "
-            "       coalesce(src.name, src.text) AS name, "
-            "       src.text AS text "
-            "LIMIT 1",
-            params={"uuid": node_uuid},
-            max_rows=1,
-        )
-        source_rows = _records(source_payload)
-        if not source_rows:
-            return DocQueryReferenceResolveResult.model_validate(
-                {
-                    "ok": True,
-                    "command": "reference-resolve",
-                    "input": {
-                        "project_id": self._project_id,
-                        "uuid": node_uuid,
-                        "limit": safe_limit,
-                    },
-                    "found": False,
-                    "source": None,
-                    "resolved_references": [],
-                    "warnings": [
-                        {"type": "source_not_found", "message": "No source node found for uuid."}
-                    ],
-                }
-            )
-
-        source = source_rows[0]
-        source_labels = source.get("labels") if isinstance(source.get("labels"), list) else []
-        source_target_sheets = (
-            source.get("target_sheets") if isinstance(source.get("target_sheets"), list) else []
-        )
-
-        references_payload = self.cypher(
-            "MATCH (src:Entity {project_id:$project_id, uuid:$uuid}) "
-            "OPTIONAL MATCH (src)-[r:REFERENCES]->(t:Entity {project_id:$project_id}) "
-            "OPTIONAL MATCH (t)-[:LOCATED_IN]->(loc1:Entity {project_id:$project_id}) "
-            "OPTIONAL MATCH (loc1)-[:LOCATED_IN]->(loc2:Entity {project_id:$project_id}) "
-            "RETURN r.rel_uuid AS rel_uuid, "
-            "       r.fact AS fact, "
-            "       r.source_sheet_ids AS source_sheet_ids, "
-            "       r.meta_target_sheet AS meta_target_sheet, "
-            "       r.meta_target_detail_id AS meta_target_detail_id, "
-            "       r.meta_target_section_id AS meta_target_section_id, "
-            "       r.meta_target_kind AS meta_target_kind, "
-            "       t.uuid AS target_uuid, "
-            "       [l IN labels(t) WHERE l <> 'Entity'] AS target_labels, "
-            "       t.sheet_id AS target_sheet_id, "
-            "       t.detail_id AS target_detail_id, "
-            "       t.section_id AS target_section_id, "
-            "       t.category AS target_category, "
-            "       coalesce(t.name, t.text) AS target_name, "
-            "       loc1.uuid AS target_located_in_uuid_1, "
-            "       [l IN labels(loc1) WHERE l <> 'Entity'] AS target_located_in_labels_1, "
-            "       coalesce(loc1.name, loc1.text) AS target_located_in_name_1, "
-            "       loc2.uuid AS target_located_in_uuid_2, "
-            "       [l IN labels(loc2) WHERE l <> 'Entity'] AS target_located_in_labels_2, "
-            "       coalesce(loc2.name, loc2.text) AS target_located_in_name_2 "
-            "ORDER BY coalesce(t.sheet_id, ''), coalesce(t.name, t.text, ''), t.uuid "
-            "LIMIT $limit",
+        payload = self._run_cypher(
+            _REFERENCE_RESOLVE_QUERY,
             params={"uuid": node_uuid, "limit": safe_limit},
             max_rows=safe_limit,
         )
-        reference_rows = _records(references_payload)
-
-        resolved_references: List[Dict[str, Any]] = []
-        warnings: List[Dict[str, Any]] = []
-        seen: set[tuple[Any, ...]] = set()
-
-        for row in reference_rows:
-            rel_uuid = row.get("rel_uuid")
-            target_uuid = row.get("target_uuid")
-            if rel_uuid is None and target_uuid is None:
-                continue
-
-            key = (
-                rel_uuid,
-                target_uuid,
-                row.get("target_located_in_uuid_1"),
-                row.get("target_located_in_uuid_2"),
-            )
-            if key in seen:
-                continue
-            seen.add(key)
-
-            target_sheet_id = row.get("target_sheet_id")
-            meta_target_sheet = row.get("meta_target_sheet")
-            sheet_match_meta = None
-            if target_sheet_id is not None and meta_target_sheet is not None:
-                sheet_match_meta = str(target_sheet_id) == str(meta_target_sheet)
-
-            sheet_in_source_targets = None
-            if target_sheet_id is not None and source_target_sheets:
-                sheet_in_source_targets = str(target_sheet_id) in {
-                    str(sid) for sid in source_target_sheets
-                }
-
-            traversal_path: List[Dict[str, Any]] = [
-                {"from_uuid": node_uuid, "rel_type": "REFERENCES", "to_uuid": target_uuid},
-            ]
-            if row.get("target_located_in_uuid_1"):
-                traversal_path.append(
-                    {
-                        "from_uuid": target_uuid,
-                        "rel_type": "LOCATED_IN",
-                        "to_uuid": row.get("target_located_in_uuid_1"),
-                    }
-                )
-            if row.get("target_located_in_uuid_2"):
-                traversal_path.append(
-                    {
-                        "from_uuid": row.get("target_located_in_uuid_1"),
-                        "rel_type": "LOCATED_IN",
-                        "to_uuid": row.get("target_located_in_uuid_2"),
-                    }
-                )
-
-            resolved_references.append(
-                {
-                    "relationship": {
-                        "rel_uuid": rel_uuid,
-                        "fact": row.get("fact"),
-                        "source_sheet_ids": row.get("source_sheet_ids"),
-                        "meta_target_sheet": meta_target_sheet,
-                        "meta_target_detail_id": row.get("meta_target_detail_id"),
-                        "meta_target_section_id": row.get("meta_target_section_id"),
-                        "meta_target_kind": row.get("meta_target_kind"),
-                    },
-                    "target": {
-                        "uuid": target_uuid,
-                        "labels": row.get("target_labels"),
-                        "sheet_id": target_sheet_id,
-                        "detail_id": row.get("target_detail_id"),
-                        "section_id": row.get("target_section_id"),
-                        "category": row.get("target_category"),
-                        "name": row.get("target_name"),
-                    },
-                    "target_context": {
-                        "located_in_1": {
-                            "uuid": row.get("target_located_in_uuid_1"),
-                            "labels": row.get("target_located_in_labels_1"),
-                            "name": row.get("target_located_in_name_1"),
-                        },
-                        "located_in_2": {
-                            "uuid": row.get("target_located_in_uuid_2"),
-                            "labels": row.get("target_located_in_labels_2"),
-                            "name": row.get("target_located_in_name_2"),
-                        },
-                    },
-                    "checks": {
-                        "target_sheet_matches_meta_target_sheet": sheet_match_meta,
-                        "target_sheet_in_source_target_sheets": sheet_in_source_targets,
-                    },
-                    "traversal_path": traversal_path,
-                }
-            )
-
-            if sheet_match_meta is False:
-                warnings.append(
-                    {
-                        "type": "meta_target_sheet_mismatch",
-                        "rel_uuid": rel_uuid,
-                        "message": "Target sheet_id does not match relationship meta_target_sheet.",
-                    }
-                )
-            if sheet_in_source_targets is False:
-                warnings.append(
-                    {
-                        "type": "source_target_sheets_mismatch",
-                        "rel_uuid": rel_uuid,
-                        "message": "Target sheet_id is not listed in source target_sheets.",
-                    }
-                )
-
-        if "Callout" not in source_labels:
-            warnings.append(
-                {
-                    "type": "source_not_callout",
-                    "message": "Source node is not labeled Callout; references may still exist.",
-                }
-            )
-        if not resolved_references:
-            warnings.append(
-                {
-                    "type": "no_outgoing_references",
-                    "message": "No outgoing REFERENCES edges found for this source node.",
-                }
-            )
-
-        return DocQueryReferenceResolveResult.model_validate(
-            {
-                "ok": True,
-                "command": "reference-resolve",
-                "input": {"project_id": self._project_id, "uuid": node_uuid, "limit": safe_limit},
-                "found": True,
-                "source": source,
-                "resolved_references": resolved_references,
-                "count": len(resolved_references),
-                "warnings": warnings,
-            }
-        )
+        return _reference_resolve_result(self._project_id, node_uuid, safe_limit, payload)
 
     def crop(
         self,
@@ -1025,35 +1794,96 @@ class DocQuery:
             raise ValueError("crop endpoint did not return image bytes")
 
         content_type = "image/png"
-        output_path = Path(output_text).expanduser()
-        if not output_path.is_absolute():
-            output_path = Path.cwd() / output_path
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(png_bytes)
+        output_path = _write_crop(output_text, png_bytes)
 
-        return DocQueryCropResult.model_validate(
-            {
-                "ok": True,
-                "output_path": str(output_path),
-                "bytes_written": len(png_bytes),
-                "content_type": content_type,
-            }
+        return DocQueryCropResult.model_construct(
+            ok=True,
+            output_path=str(output_path),
+            bytes_written=len(png_bytes),
+            content_type=content_type,
+        )
+
+    def crop_many(
+        self,
+        crops: Sequence[Dict[str, Any]],
+        *,
+        max_concurrency: Optional[int] = 8,
+    ) -> List[DocQueryCropResult]:
+        """Run several crops concurrently; each item holds ``crop`` keyword arguments.
+
+        Results keep input order. The first failure is raised right away; crops already
+        in flight still run to completion in the background.
+        """
+        return _map_threaded(
+            lambda kwargs: self.crop(**kwargs),
+            list(crops),
+            max_concurrency=max_concurrency,
         )
 
 
 class AsyncDocQuery:
-    """DocQuery traversal API (async)."""
+    """DocQuery traversal API (async).
+
+    After ``cache_enable(ttl)``, ``node_get``, ``sheet_entities``, ``search``,
+    ``neighbors``, ``sheet_summary`` and ``sheet_list`` results are cached for ``ttl``
+    seconds and returned as copies. Sheet uploads, deletes and completed jobs from the
+    same project handle, and ``cypher`` statements with a write clause, clear the
+    cache; writes made elsewhere show up once entries expire.
+    """
 
-    def __init__(self, client: "AsyncBaseClient", project_id: str):
+    __slots__ = ("_client", "_project_id", "_read_cache")
+
+    def __init__(
+        self,
+        client: "AsyncBaseClient",
+        project_id: str,
+        *,
+        read_cache: Optional[_TTLMemo] = None,
+    ):
         self._client = client
         self._project_id = project_id
+        self._read_cache = read_cache if read_cache is not None else _new_read_cache()
+
+    async def _memoized(self, key: Hashable, fetch: Callable[[], Awaitable[_ModelT]]) -> _ModelT:
+        memo = self._read_cache
+        if not memo.enabled:
+            return await fetch()
+        cached: Optional[_ModelT] = memo.get(key)
+        if cached is None:
+            cached = await fetch()
+            memo.set(key, cached)
+        # Hand out copies so a caller mutating its result cannot alter the cached one.
+        return cached.model_copy(deep=True)
+
+    async def _cached_get(
+        self, path: str, params: Dict[str, Any], cast_to: Type[_ModelT]
+    ) -> _ModelT:
+        async def fetch() -> _ModelT:
+            result = await self._client.get(path, params=params, cast_to=cast_to)
+            return cast(_ModelT, result)
+
+        return await self._memoized(_read_cache_key(path, params), fetch)
+
+    def cache_enable(self, ttl: float = 60.0, *, maxsize: int = 4096) -> None:
+        """Cache read results for ``ttl`` seconds; ``ttl=0`` turns caching off again."""
+        self._read_cache.clear()
+        self._read_cache.ttl = ttl
+        self._read_cache.maxsize = maxsize
+
+    def cache_clear(self) -> None:
+        """Drop all cached read results."""
+        self._read_cache.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return read-cache hit/miss counters and current size."""
+        return self._read_cache.info()
 
     async def node_get(self, uuid: str) -> DocQueryNodeGetResult:
         uuid = _normalize_text(uuid, field_name="uuid")
-        return await self._client.get(
+        return await self._cached_get(
             f"/projects/{self._project_id}/node-get",
-            params={"uuid": uuid},
-            cast_to=DocQueryNodeGetResult,
+            {"uuid": uuid},
+            DocQueryNodeGetResult,
         )
 
     async def sheet_entities(
@@ -1063,14 +1893,10 @@ class AsyncDocQuery:
         entity_type: Optional[str] = None,
         limit: int = 200,
     ) -> DocQuerySheetEntitiesResult:
-        sheet_id = _normalize_text(sheet_id, field_name="sheet_id")
-        params: Dict[str, Any] = {"sheet_id": sheet_id, "limit": int(limit)}
-        if entity_type is not None:
-            params["entity_type"] = str(entity_type)
-        return await self._client.get(
+        return await self._cached_get(
             f"/projects/{self._project_id}/sheet-entities",
-            params=params,
-            cast_to=DocQuerySheetEntitiesResult,
+            _sheet_entities_params(sheet_id, entity_type=entity_type, limit=limit),
+            DocQuerySheetEntitiesResult,
         )
 
     async def search(
@@ -1080,12 +1906,10 @@ class AsyncDocQuery:
         index: str = "entity_search",
         limit: int = 20,
     ) -> DocQuerySearchResult:
-        query = _normalize_text(query, field_name="query")
-        index = _normalize_text(index, field_name="index")
-        return await self._client.get(
+        return await self._cached_get(
             f"/projects/{self._project_id}/search",
-            params={"query": query, "index": index, "limit": int(limit)},
-            cast_to=DocQuerySearchResult,
+            _search_params(query, index=index, limit=limit),
+            DocQuerySearchResult,
         )
 
     async def neighbors(
@@ -1098,26 +1922,18 @@ class AsyncDocQuery:
         radius: float = 200.0,
         limit: int = 50,
     ) -> DocQueryNeighborsResult:
-        uuid = _normalize_text(uuid, field_name="uuid")
-        mode = _normalize_text(mode, field_name="mode").lower()
-        if mode not in {"graph", "spatial", "both"}:
-            raise ValueError("mode must be one of: graph, spatial, both")
-        direction = _normalize_text(direction, field_name="direction").lower()
-        if direction not in {"in", "out", "both"}:
-            raise ValueError("direction must be one of: in, out, both")
-        params: Dict[str, Any] = {
-            "uuid": uuid,
-            "mode": mode,
-            "direction": direction,
-            "radius": float(radius),
-            "limit": int(limit),
-        }
-        if relationship_type is not None:
-            params["relationship_type"] = str(relationship_type)
-        return await self._client.get(
+        params = _neighbors_params(
+            uuid,
+            mode=mode,
+            direction=direction,
+            relationship_type=relationship_type,
+            radius=radius,
+            limit=limit,
+        )
+        return await self._cached_get(
             f"/projects/{self._project_id}/neighbors",
-            params=params,
-            cast_to=DocQueryNeighborsResult,
+            params,
+            DocQueryNeighborsResult,
         )
 
     async def cypher(
@@ -1127,15 +1943,26 @@ class AsyncDocQuery:
         params: Optional[Dict[str, Any]] = None,
         max_rows: int = 500,
     ) -> DocQueryCypherResult:
-        query = _normalize_text(query, field_name="query")
-        body: Dict[str, Any] = {
-            "query": query,
-            "params": dict(params or {}),
-            "max_rows": int(max_rows),
-        }
+        """Run a raw Cypher statement.
+
+        Statements containing CREATE, MERGE, SET, DELETE or REMOVE clear the read
+        cache; call ``cache_clear()`` after writes this check cannot see.
+        """
+        result = await self._run_cypher(query, params=params, max_rows=max_rows)
+        if _cypher_may_write(query):
+            self._read_cache.clear()
+        return result
+
+    async def _run_cypher(
+        self,
+        query: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        max_rows: int,
+    ) -> DocQueryCypherResult:
         return await self._client.post(
             f"/projects/{self._project_id}/cypher",
-            json=body,
+            json=_cypher_body(query, params=params, max_rows=max_rows),
             cast_to=DocQueryCypherResult,
         )
 
@@ -1144,254 +1971,51 @@ class AsyncDocQuery:
         sheet_id: str,
         *,
         orphan_limit: int = 10,
+        top_k_labels: int = 500,
+        top_k_rels: int = 500,
     ) -> DocQuerySheetSummaryResult:
-        sheet_id = _normalize_text(sheet_id, field_name="sheet_id")
-        safe_orphan_limit = max(1, min(int(orphan_limit), 200))
-
-        sheet_node_payload = await self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
-            "RETURN s.sheet_id AS sheet_id, s.uuid AS uuid, "
-            "coalesce(s.name, s.text) AS name LIMIT 1",
-            params={"sheet_id": sheet_id},
-            max_rows=1,
+        inputs = _sheet_summary_inputs(
+            self._project_id,
+            sheet_id,
+            orphan_limit=orphan_limit,
+            top_k_labels=top_k_labels,
+            top_k_rels=top_k_rels,
         )
-        label_counts_payload = await self.cypher(
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "UNWIND labels(n) AS label "
-            "WITH label WHERE label <> 'Entity' "
-            "RETURN label, count(*) AS count ORDER BY count DESC, label",
-            params={"sheet_id": sheet_id},
-            max_rows=500,
-        )
-        rel_counts_payload = await self.cypher(
-            "MATCH ()-[r]->() "
-            "WHERE r.project_id = $project_id "
-            "  AND $sheet_id IN coalesce(r.source_sheet_ids, []) "
-            "RETURN type(r) AS rel_type, count(*) AS count "
-            "ORDER BY count DESC, rel_type",
-            params={"sheet_id": sheet_id},
-            max_rows=500,
-        )
-        reachability_payload = await self.cypher(
-            "OPTIONAL MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id}) "
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "WITH s, collect(n) AS nodes "
-            "UNWIND nodes AS n "
-            "WITH s, n, n:Sheet AS is_sheet "
-            "RETURN "
-            "(s IS NOT NULL) AS has_sheet_node, "
-            "count(CASE WHEN is_sheet THEN 1 END) AS sheet_node_count, "
-            "count(CASE WHEN NOT is_sheet THEN 1 END) AS non_sheet_total, "
-            "count(CASE WHEN NOT is_sheet AND s IS NOT NULL "
-            "           AND EXISTS { MATCH (s)<-[:LOCATED_IN*1..2]-(n) } "
-            "      THEN 1 END) AS reachable_non_sheet",
-            params={"sheet_id": sheet_id},
-            max_rows=1,
-        )
-        orphan_payload = await self.cypher(
-            "MATCH (n:Entity {project_id:$project_id, sheet_id:$sheet_id}) "
-            "WHERE NOT n:Sheet "
-            "  AND NOT EXISTS { "
-            "    MATCH (s:Entity:Sheet {project_id:$project_id, sheet_id:$sheet_id})"
-            "<-[:LOCATED_IN*1..2]-(n) "
-            "  } "
-            "RETURN n.uuid AS uuid, "
-            "       [l IN labels(n) WHERE l <> 'Entity'] AS labels, "
-            "       n.category AS category, "
-            "       coalesce(n.name, n.text) AS name "
-            "ORDER BY coalesce(n.name, n.text), n.uuid "
-            "LIMIT $orphan_limit",
-            params={"sheet_id": sheet_id, "orphan_limit": safe_orphan_limit},
-            max_rows=safe_orphan_limit,
-        )
-
-        sheet_rows = _records(sheet_node_payload)
-        label_rows = _records(label_counts_payload)
-        rel_rows = _records(rel_counts_payload)
-        reachability_rows = _records(reachability_payload)
-        orphan_rows = _records(orphan_payload)
-
-        reachability: Dict[str, Any] = {
-            "has_sheet_node": False,
-            "sheet_node_count": 0,
-            "non_sheet_total": 0,
-            "reachable_non_sheet": 0,
-            "unreachable_non_sheet": 0,
-        }
-        if reachability_rows:
-            first = reachability_rows[0]
-            has_sheet_node = bool(first.get("has_sheet_node"))
-            sheet_node_count = int(first.get("sheet_node_count") or 0)
-            non_sheet_total = int(first.get("non_sheet_total") or 0)
-            reachable_non_sheet = int(first.get("reachable_non_sheet") or 0)
-            reachability = {
-                "has_sheet_node": has_sheet_node,
-                "sheet_node_count": sheet_node_count,
-                "non_sheet_total": non_sheet_total,
-                "reachable_non_sheet": reachable_non_sheet,
-                "unreachable_non_sheet": max(0, non_sheet_total - reachable_non_sheet),
-            }
 
-        warnings: List[Dict[str, Any]] = []
-        if not reachability["has_sheet_node"]:
-            warnings.append(
-                {
-                    "type": "missing_sheet_node",
-                    "message": f"No :Entity:Sheet node found for sheet_id={sheet_id}.",
-                }
-            )
-        if reachability["sheet_node_count"] > 1:
-            warnings.append(
-                {
-                    "type": "duplicate_sheet_nodes",
-                    "message": (
-                        f"Found {reachability['sheet_node_count']} Sheet nodes for "
-                        f"sheet_id={sheet_id}; expected 1."
-                    ),
-                }
+        async def fetch() -> DocQuerySheetSummaryResult:
+            payload = await self._run_cypher(
+                _SHEET_SUMMARY_QUERY,
+                params={k: v for k, v in inputs.items() if k != "project_id"},
+                max_rows=1,
             )
-        if reachability["unreachable_non_sheet"] > 0:
-            warnings.append(
-                {
-                    "type": "unreachable_entities",
-                    "message": (
-                        f"{reachability['unreachable_non_sheet']} non-sheet entities "
-                        "are not reachable "
-                        f"from sheet {sheet_id} via LOCATED_IN*1..2."
-                    ),
-                }
-            )
-
-        return DocQuerySheetSummaryResult.model_validate(
-            {
-                "ok": True,
-                "command": "sheet-summary",
-                "input": {
-                    "project_id": self._project_id,
-                    "sheet_id": sheet_id,
-                    "orphan_limit": safe_orphan_limit,
-                },
-                "sheet_node": (sheet_rows[0] if sheet_rows else None),
-                "node_label_counts": label_rows,
-                "relationship_counts": rel_rows,
-                "reachability": reachability,
-                "orphan_examples": orphan_rows,
-                "warnings": warnings,
-            }
-        )
+            return _sheet_summary_result(inputs, payload)
 
-    async def sheet_list(self) -> DocQuerySheetListResult:
-        sheet_nodes_payload = await self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id}) "
-            "RETURN s.sheet_id AS sheet_id, s.uuid AS uuid, coalesce(s.name, s.text) AS name "
-            "ORDER BY s.sheet_id, s.uuid",
-            max_rows=5000,
-        )
-        inventory_payload = await self.cypher(
-            "MATCH (n:Entity {project_id:$project_id}) "
-            "RETURN n.sheet_id AS sheet_id, count(n) AS entity_count "
-            "ORDER BY n.sheet_id",
-            max_rows=5000,
-        )
-        duplicate_sheet_nodes_payload = await self.cypher(
-            "MATCH (s:Entity:Sheet {project_id:$project_id}) "
-            "WITH s.sheet_id AS sheet_id, count(*) AS sheet_node_count "
-            "WHERE sheet_node_count > 1 "
-            "RETURN sheet_id, sheet_node_count "
-            "ORDER BY sheet_node_count DESC, sheet_id",
-            max_rows=200,
-        )
-        missing_sheet_id_payload = await self.cypher(
-            "MATCH (n:Entity {project_id:$project_id}) "
-            "WHERE n.sheet_id IS NULL OR trim(toString(n.sheet_id)) = '' "
-            "RETURN count(n) AS missing_sheet_id_count",
-            max_rows=1,
-        )
+        return await self._memoized(_read_cache_key("sheet-summary", inputs), fetch)
 
-        sheet_nodes = _records(sheet_nodes_payload)
-        inventory = _records(inventory_payload)
-        duplicate_sheet_nodes = _records(duplicate_sheet_nodes_payload)
-        missing_sheet_rows = _records(missing_sheet_id_payload)
-        missing_sheet_id_count = (
-            int(missing_sheet_rows[0].get("missing_sheet_id_count") or 0)
-            if missing_sheet_rows
-            else 0
-        )
-
-        sheet_node_ids = {str(r["sheet_id"]) for r in sheet_nodes if r.get("sheet_id")}
-        inventory_ids = {str(r["sheet_id"]) for r in inventory if r.get("sheet_id")}
-        inventory_counts: Dict[str, int] = {
-            str(r["sheet_id"]): int(r.get("entity_count") or 0)
-            for r in inventory
-            if r.get("sheet_id")
-        }
-        total_entities = sum(int(r.get("entity_count") or 0) for r in inventory)
-        inventory_without_sheet_node = sorted(inventory_ids - sheet_node_ids)
-        sheet_nodes_without_inventory = sorted(sheet_node_ids - inventory_ids)
-        sheet_nodes_with_only_self = sorted(
-            sid for sid in sheet_node_ids if inventory_counts.get(sid, 0) == 1
-        )
-
-        mismatch_warnings: List[Dict[str, Any]] = []
-        if inventory_without_sheet_node:
-            mismatch_warnings.append(
-                {
-                    "type": "inventory_sheet_id_without_sheet_node",
-                    "sheet_ids": inventory_without_sheet_node,
-                    "message": "Entities exist for sheet_id values that do not have a Sheet node.",
-                }
-            )
-        if sheet_nodes_without_inventory:
-            mismatch_warnings.append(
-                {
-                    "type": "sheet_node_without_inventory",
-                    "sheet_ids": sheet_nodes_without_inventory,
-                    "message": "Sheet nodes exist with no matching entity inventory rows.",
-                }
-            )
-        if duplicate_sheet_nodes:
-            mismatch_warnings.append(
-                {
-                    "type": "duplicate_sheet_nodes",
-                    "duplicates": duplicate_sheet_nodes,
-                    "message": "Multiple Sheet nodes found for one or more sheet_id values.",
-                }
-            )
-        if missing_sheet_id_count > 0:
-            mismatch_warnings.append(
-                {
-                    "type": "entities_missing_sheet_id",
-                    "count": missing_sheet_id_count,
-                    "message": "Some entities are missing sheet_id.",
-                }
-            )
-        if sheet_nodes_with_only_self:
-            mismatch_warnings.append(
-                {
-                    "type": "sheet_nodes_without_non_sheet_entities",
-                    "sheet_ids": sheet_nodes_with_only_self,
-                    "message": "Sheet IDs where inventory count is only the Sheet node itself.",
-                }
+    async def sheet_list(
+        self,
+        *,
+        after_sheet_id: Optional[str] = None,
+        limit: int = 5000,
+    ) -> DocQuerySheetListResult:
+        """List sheets in pages of up to ``limit`` sheet_id values.
+
+        Pass the previous result's ``next_after_sheet_id`` as ``after_sheet_id`` to
+        fetch the next page; it is ``None`` once the last page has been returned.
+        sheet_ids are paged in string order. Project-wide duplicate Sheet node and
+        missing sheet_id checks are only reported on the first page.
+        """
+        inputs = _sheet_list_inputs(self._project_id, after_sheet_id=after_sheet_id, limit=limit)
+
+        async def fetch() -> DocQuerySheetListResult:
+            payload = await self._run_cypher(
+                _SHEET_LIST_QUERY,
+                params={k: v for k, v in inputs.items() if k != "project_id"},
+                max_rows=1,
             )
+            return _sheet_list_result(inputs, payload)
 
-        return DocQuerySheetListResult.model_validate(
-            {
-                "ok": True,
-                "command": "sheet-list",
-                "input": {
-                    "project_id": self._project_id,
-                },
-                "sheet_nodes": sheet_nodes,
-                "entity_sheet_inventory": inventory,
-                "totals": {
-                    "sheet_node_count": len(sheet_nodes),
-                    "inventory_sheet_id_count": len(inventory_ids),
-                    "total_entities": total_entities,
-                    "missing_sheet_id_count": missing_sheet_id_count,
-                },
-                "mismatch_warnings": mismatch_warnings,
-            }
-        )
+        return await self._memoized(_read_cache_key("sheet-list", inputs), fetch)
 
     async def reference_resolve(
         self,
@@ -1402,215 +2026,12 @@ class AsyncDocQuery:
         node_uuid = _normalize_text(uuid, field_name="uuid")
         safe_limit = max(1, min(int(limit), 200))
 
-        source_payload = await self.cypher(
-            "MATCH (src:Entity {project_id:$project_id, uuid:$uuid}) "
-            "RETURN src.uuid AS uuid, "
-            "       [l IN labels(src) WHERE l <> 'Entity'] AS labels, "
-            "       src.sheet_id AS sheet_id, "
-            "       src.detail_id AS detail_id, "
-            "       src.section_id AS section_id, "
-            "       src.target_sheets AS target_sheets, "
-            "       src.category AS category, "
-            "       coalesce(src.name, src.text) AS name, "
-            "       src.text AS text "
-            "LIMIT 1",
-            params={"uuid": node_uuid},
-            max_rows=1,
-        )
-        source_rows = _records(source_payload)
-        if not source_rows:
-            return DocQueryReferenceResolveResult.model_validate(
-                {
-                    "ok": True,
-                    "command": "reference-resolve",
-                    "input": {
-                        "project_id": self._project_id,
-                        "uuid": node_uuid,
-                        "limit": safe_limit,
-                    },
-                    "found": False,
-                    "source": None,
-                    "resolved_references": [],
-                    "warnings": [
-                        {"type": "source_not_found", "message": "No source node found for uuid."}
-                    ],
-                }
-            )
-
-        source = source_rows[0]
-        source_labels = source.get("labels") if isinstance(source.get("labels"), list) else []
-        source_target_sheets = (
-            source.get("target_sheets") if isinstance(source.get("target_sheets"), list) else []
-        )
-
-        references_payload = await self.cypher(
-            "MATCH (src:Entity {project_id:$project_id, uuid:$uuid}) "
-            "OPTIONAL MATCH (src)-[r:REFERENCES]->(t:Entity {project_id:$project_id}) "
-            "OPTIONAL MATCH (t)-[:LOCATED_IN]->(loc1:Entity {project_id:$project_id}) "
-            "OPTIONAL MATCH (loc1)-[:LOCATED_IN]->(loc2:Entity {project_id:$project_id}) "
-            "RETURN r.rel_uuid AS rel_uuid, "
-            "       r.fact AS fact, "
-            "       r.source_sheet_ids AS source_sheet_ids, "
-            "       r.meta_target_sheet AS meta_target_sheet, "
-            "       r.meta_target_detail_id AS meta_target_detail_id, "
-            "       r.meta_target_section_id AS meta_target_section_id, "
-            "       r.meta_target_kind AS meta_target_kind, "
-            "       t.uuid AS target_uuid, "
-            "       [l IN labels(t) WHERE l <> 'Entity'] AS target_labels, "
-            "       t.sheet_id AS target_sheet_id, "
-            "       t.detail_id AS target_detail_id, "
-            "       t.section_id AS target_section_id, "
-            "       t.category AS target_category, "
-            "       coalesce(t.name, t.text) AS target_name, "
-            "       loc1.uuid AS target_located_in_uuid_1, "
-            "       [l IN labels(loc1) WHERE l <> 'Entity'] AS target_located_in_labels_1, "
-            "       coalesce(loc1.name, loc1.text) AS target_located_in_name_1, "
-            "       loc2.uuid AS target_located_in_uuid_2, "
-            "       [l IN labels(loc2) WHERE l <> 'Entity'] AS target_located_in_labels_2, "
-            "       coalesce(loc2.name, loc2.text) AS target_located_in_name_2 "
-            "ORDER BY coalesce(t.sheet_id, ''), coalesce(t.name, t.text, ''), t.uuid "
-            "LIMIT $limit",
+        payload = await self._run_cypher(
+            _REFERENCE_RESOLVE_QUERY,
             params={"uuid": node_uuid, "limit": safe_limit},
             max_rows=safe_limit,
         )
-        reference_rows = _records(references_payload)
-
-        resolved_references: List[Dict[str, Any]] = []
-        warnings: List[Dict[str, Any]] = []
-        seen: set[tuple[Any, ...]] = set()
-
-        for row in reference_rows:
-            rel_uuid = row.get("rel_uuid")
-            target_uuid = row.get("target_uuid")
-            if rel_uuid is None and target_uuid is None:
-                continue
-
-            key = (
-                rel_uuid,
-                target_uuid,
-                row.get("target_located_in_uuid_1"),
-                row.get("target_located_in_uuid_2"),
-            )
-            if key in seen:
-                continue
-            seen.add(key)
-
-            target_sheet_id = row.get("target_sheet_id")
-            meta_target_sheet = row.get("meta_target_sheet")
-            sheet_match_meta = None
-            if target_sheet_id is not None and meta_target_sheet is not None:
-                sheet_match_meta = str(target_sheet_id) == str(meta_target_sheet)
-
-            sheet_in_source_targets = None
-            if target_sheet_id is not None and source_target_sheets:
-                sheet_in_source_targets = str(target_sheet_id) in {
-                    str(sid) for sid in source_target_sheets
-                }
-
-            traversal_path: List[Dict[str, Any]] = [
-                {"from_uuid": node_uuid, "rel_type": "REFERENCES", "to_uuid": target_uuid},
-            ]
-            if row.get("target_located_in_uuid_1"):
-                traversal_path.append(
-                    {
-                        "from_uuid": target_uuid,
-                        "rel_type": "LOCATED_IN",
-                        "to_uuid": row.get("target_located_in_uuid_1"),
-                    }
-                )
-            if row.get("target_located_in_uuid_2"):
-                traversal_path.append(
-                    {
-                        "from_uuid": row.get("target_located_in_uuid_1"),
-                        "rel_type": "LOCATED_IN",
-                        "to_uuid": row.get("target_located_in_uuid_2"),
-                    }
-                )
-
-            resolved_references.append(
-                {
-                    "relationship": {
-                        "rel_uuid": rel_uuid,
-                        "fact": row.get("fact"),
-                        "source_sheet_ids": row.get("source_sheet_ids"),
-                        "meta_target_sheet": meta_target_sheet,
-                        "meta_target_detail_id": row.get("meta_target_detail_id"),
-                        "meta_target_section_id": row.get("meta_target_section_id"),
-                        "meta_target_kind": row.get("meta_target_kind"),
-                    },
-                    "target": {
-                        "uuid": target_uuid,
-                        "labels": row.get("target_labels"),
-                        "sheet_id": target_sheet_id,
-                        "detail_id": row.get("target_detail_id"),
-                        "section_id": row.get("target_section_id"),
-                        "category": row.get("target_category"),
-                        "name": row.get("target_name"),
-                    },
-                    "target_context": {
-                        "located_in_1": {
-                            "uuid": row.get("target_located_in_uuid_1"),
-                            "labels": row.get("target_located_in_labels_1"),
-                            "name": row.get("target_located_in_name_1"),
-                        },
-                        "located_in_2": {
-                            "uuid": row.get("target_located_in_uuid_2"),
-                            "labels": row.get("target_located_in_labels_2"),
-                            "name": row.get("target_located_in_name_2"),
-                        },
-                    },
-                    "checks": {
-                        "target_sheet_matches_meta_target_sheet": sheet_match_meta,
-                        "target_sheet_in_source_target_sheets": sheet_in_source_targets,
-                    },
-                    "traversal_path": traversal_path,
-                }
-            )
-
-            if sheet_match_meta is False:
-                warnings.append(
-                    {
-                        "type": "meta_target_sheet_mismatch",
-                        "rel_uuid": rel_uuid,
-                        "message": "Target sheet_id does not match relationship meta_target_sheet.",
-                    }
-                )
-            if sheet_in_source_targets is False:
-                warnings.append(
-                    {
-                        "type": "source_target_sheets_mismatch",
-                        "rel_uuid": rel_uuid,
-                        "message": "Target sheet_id is not listed in source target_sheets.",
-                    }
-                )
-
-        if "Callout" not in source_labels:
-            warnings.append(
-                {
-                    "type": "source_not_callout",
-                    "message": "Source node is not labeled Callout; references may still exist.",
-                }
-            )
-        if not resolved_references:
-            warnings.append(
-                {
-                    "type": "no_outgoing_references",
-                    "message": "No outgoing REFERENCES edges found for this source node.",
-                }
-            )
-
-        return DocQueryReferenceResolveResult.model_validate(
-            {
-                "ok": True,
-                "command": "reference-resolve",
-                "input": {"project_id": self._project_id, "uuid": node_uuid, "limit": safe_limit},
-                "found": True,
-                "source": source,
-                "resolved_references": resolved_references,
-                "count": len(resolved_references),
-                "warnings": warnings,
-            }
-        )
+        return _reference_resolve_result(self._project_id, node_uuid, safe_limit, payload)
 
     async def crop(
         self,
@@ -1640,20 +2061,32 @@ class AsyncDocQuery:
         if not isinstance(png_bytes, bytes):
             raise ValueError("crop endpoint did not return image bytes")
 
+        import asyncio
+
         content_type = "image/png"
-        output_path = Path(output_text).expanduser()
-        if not output_path.is_absolute():
-            output_path = Path.cwd() / output_path
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(png_bytes)
+        # Disk I/O runs in a worker thread so large crops don't stall the event loop.
+        output_path = await asyncio.to_thread(_write_crop, output_text, png_bytes)
+
+        return DocQueryCropResult.model_construct(
+            ok=True,
+            output_path=str(output_path),
+            bytes_written=len(png_bytes),
+            content_type=content_type,
+        )
 
-        return DocQueryCropResult.model_validate(
-            {
-                "ok": True,
-                "output_path": str(output_path),
-                "bytes_written": len(png_bytes),
-                "content_type": content_type,
-            }
+    async def crop_many(
+        self,
+        crops: Sequence[Dict[str, Any]],
+        *,
+        max_concurrency: Optional[int] = 8,
+    ) -> List[DocQueryCropResult]:
+        """Run several crops concurrently; each item holds ``crop`` keyword arguments.
+
+        Results keep input order.
+        """
+        return await _gather_bounded(
+            [functools.partial(self.crop, **kwargs) for kwargs in crops],
+            max_concurrency=max_concurrency,
         )
 
 
@@ -1663,7 +2096,10 @@ class AsyncDocQuery:
 
 
 class ProjectInstance:
-    """Project handle with nested resources (sync)."""
+    """Project handle with nested resources (sync).
+
+    Nested resources share the parent client's pooled ``httpx.Client``.
+    """
 
     def __init__(self, client: "BaseClient", project: Project):
         self._client = client
@@ -1686,13 +2122,17 @@ class ProjectInstance:
         """Raw project model data."""
         return self._project
 
+    @cached_property
+    def _read_cache(self) -> _TTLMemo:
+        return _new_read_cache()
+
     @cached_property
     def sheets(self) -> Sheets:
-        return Sheets(self._client, self.id)
+        return Sheets(self._client, self.id, read_cache=self._read_cache)
 
     @cached_property
     def docquery(self) -> DocQuery:
-        return DocQuery(self._client, self.id)
+        return DocQuery(self._client, self.id, read_cache=self._read_cache)
 
     def delete(self) -> ProjectDeleteResult:
         """Delete this project."""
@@ -1700,7 +2140,10 @@ class ProjectInstance:
 
 
 class AsyncProjectInstance:
-    """Project handle with nested resources (async)."""
+    """Project handle with nested resources (async).
+
+    Nested resources share the parent client's pooled ``httpx.AsyncClient``.
+    """
 
     def __init__(self, client: "AsyncBaseClient", project: Project):
         self._client = client
@@ -1723,13 +2166,17 @@ class AsyncProjectInstance:
         """Raw project model data."""
         return self._project
 
+    @cached_property
+    def _read_cache(self) -> _TTLMemo:
+        return _new_read_cache()
+
     @cached_property
     def sheets(self) -> AsyncSheets:
-        return AsyncSheets(self._client, self.id)
+        return AsyncSheets(self._client, self.id, read_cache=self._read_cache)
 
     @cached_property
     def docquery(self) -> AsyncDocQuery:
-        return AsyncDocQuery(self._client, self.id)
+        return AsyncDocQuery(self._client, self.id, read_cache=self._read_cache)
 
     async def delete(self) -> ProjectDeleteResult:
         """Delete this project."""
@@ -1758,8 +2205,12 @@ class Projects:
 
     def list(self) -> List[Project]:
         """List projects available to the API key."""
-        response = self._client.get("/projects")
-        return [Project.model_validate(item) for item in response.get("projects", [])]
+        response: ProjectListResponse = self._client.get("/projects", cast_to=ProjectListResponse)
+        return response.projects
+
+    def list_instances(self) -> List[ProjectInstance]:
+        """List projects as ready-to-use handles, from the same single request."""
+        return [ProjectInstance(self._client, project) for project in self.list()]
 
     def open(
         self,
@@ -1770,12 +2221,11 @@ class Projects:
     ) -> ProjectInstance:
         """Create a project handle without performing a lookup call."""
         project_id = _normalize_text(project_id, field_name="project_id")
-        project = Project.model_validate(
-            {
-                "id": project_id,
-                "name": name or project_id,
-                "description": description,
-            }
+        # Fields are plain strings the caller just handed us; skip re-validation.
+        project = Project.model_construct(
+            id=project_id,
+            name=name or project_id,
+            description=description,
         )
         return ProjectInstance(self._client, project)
 
@@ -1801,8 +2251,14 @@ class AsyncProjects:
 
     async def list(self) -> List[Project]:
         """List projects available to the API key."""
-        response = await self._client.get("/projects")
-        return [Project.model_validate(item) for item in response.get("projects", [])]
+        response: ProjectListResponse = await self._client.get(
+            "/projects", cast_to=ProjectListResponse
+        )
+        return response.projects
+
+    async def list_instances(self) -> List[AsyncProjectInstance]:
+        """List projects as ready-to-use handles, from the same single request."""
+        return [AsyncProjectInstance(self._client, project) for project in await self.list()]
 
     def open(
         self,
@@ -1813,12 +2269,10 @@ class AsyncProjects:
     ) -> AsyncProjectInstance:
         """Create a project handle without performing a lookup call."""
         project_id = _normalize_text(project_id, field_name="project_id")
-        project = Project.model_validate(
-            {
-                "id": project_id,
-                "name": name or project_id,
-                "description": description,
-            }
+        project = Project.model_construct(
+            id=project_id,
+            name=name or project_id,
+            description=description,
         )
         return AsyncProjectInstance(self._client, project)
 
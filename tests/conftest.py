@@ -1,9 +1,30 @@
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from struai.models.projects import Project
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _no_real_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep poll/backoff loops from ever blocking the suite on a real sleep."""
+    monkeypatch.setattr(time, "sleep", lambda _seconds: None)
+
+
+@pytest.fixture
+def project_model() -> Project:
+    """A fresh ``proj`` Project model for resource tests."""
+    from struai.models.projects import Project
+
+    return Project.model_validate({"id": "proj", "name": "Smoke"})
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
 import pytest
 
-from struai.resources.projects import ProjectInstance
+from struai.models.projects import Project
+from struai.resources.projects import AsyncProjectInstance, ProjectInstance
+
+
+class CropRequest(NamedTuple):
+    path: str
+    json: Dict[str, Any]
+    expect_bytes: bool
 
 
 class CropClient:
     def __init__(self) -> None:
-        self.requests: list[dict[str, Any]] = []
+        self.requests: list[CropRequest] = []
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None, cast_to=None):
         raise AssertionError(f"unexpected GET {path}")
@@ -21,7 +28,7 @@ class CropClient:
         if path != "/projects/proj/crop":
             raise AssertionError(f"unexpected POST {path}")
 
-        self.requests.append({"path": path, "json": json, "expect_bytes": expect_bytes})
+        self.requests.append(CropRequest(path, json, expect_bytes))
         if not expect_bytes:
             raise AssertionError("crop endpoint should request binary response")
 
@@ -32,17 +39,27 @@ class CropClient:
         raise AssertionError(f"unexpected DELETE {path}")
 
 
-def _project_instance(client: Any) -> ProjectInstance:
-    from struai.models.projects import Project
+class AsyncCropClient(CropClient):
+    async def post(  # type: ignore[override]
+        self, path: str, *, files=None, data=None, json=None, cast_to=None, expect_bytes=False
+    ):
+        return CropClient.post(self, path, json=json, expect_bytes=expect_bytes)
+
+
+@pytest.fixture
+def client() -> CropClient:
+    return CropClient()
 
-    project = Project.model_validate({"id": "proj", "name": "Crop Tests"})
-    return ProjectInstance(client, project)
 
+@pytest.fixture
+def project(client: CropClient, project_model: Project) -> ProjectInstance:
+    return ProjectInstance(client, project_model)
 
-def test_crop_bbox_mode_posts_to_server_and_writes_output(tmp_path: Path) -> None:
+
+def test_crop_bbox_mode_posts_to_server_and_writes_output(
+    tmp_path: Path, client: CropClient, project: ProjectInstance
+) -> None:
     output_path = tmp_path / "crop.png"
-    client = CropClient()
-    project = _project_instance(client)
 
     result = project.docquery.crop(
         output=output_path,
@@ -50,8 +67,8 @@ def test_crop_bbox_mode_posts_to_server_and_writes_output(tmp_path: Path) -> Non
         page_hash="page_hash_1",
     )
 
-    assert output_path.exists()
-    assert output_path.read_bytes().startswith(b"\x89PNG")
+    with output_path.open("rb") as handle:
+        assert handle.read(8) == b"\x89PNG\r\n\x1a\n"
     assert result.ok is True
     assert result.output_path == str(output_path)
     assert result.bytes_written > 0
@@ -59,28 +76,67 @@ def test_crop_bbox_mode_posts_to_server_and_writes_output(tmp_path: Path) -> Non
 
     assert len(client.requests) == 1
     request = client.requests[0]
-    assert request["expect_bytes"] is True
-    assert request["json"]["bbox"] == [10.0, 20.0, 30.0, 45.0]
-    assert request["json"]["page_hash"] == "page_hash_1"
+    assert request.expect_bytes is True
+    assert request.json["bbox"] == [10.0, 20.0, 30.0, 45.0]
+    assert request.json["page_hash"] == "page_hash_1"
 
 
-def test_crop_uuid_mode_posts_uuid_only(tmp_path: Path) -> None:
+def test_crop_uuid_mode_posts_uuid_only(
+    tmp_path: Path, client: CropClient, project: ProjectInstance
+) -> None:
     output_path = tmp_path / "crop_uuid.png"
-    client = CropClient()
-    project = _project_instance(client)
 
     result = project.docquery.crop(output=output_path, uuid="node-123")
 
     assert output_path.exists()
     assert result.bytes_written > 0
     assert len(client.requests) == 1
-    assert client.requests[0]["json"] == {"uuid": "node-123"}
+    assert client.requests[0].json == {"uuid": "node-123"}
+
+
+def test_crop_output_follows_symlinked_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, project: ProjectInstance
+) -> None:
+    (tmp_path / "real" / "sub").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(tmp_path / "real" / "sub", target_is_directory=True)
+    monkeypatch.chdir(tmp_path)
+
+    project.docquery.crop(output="link/../crop.png", uuid="node-123")
 
+    assert (tmp_path / "real" / "crop.png").exists()
+    assert not (tmp_path / "crop.png").exists()
 
-def test_crop_bbox_requires_page_hash(tmp_path: Path) -> None:
+
+def test_crop_bbox_requires_page_hash(tmp_path: Path, project: ProjectInstance) -> None:
     output_path = tmp_path / "crop_fail.png"
-    client = CropClient()
-    project = _project_instance(client)
 
     with pytest.raises(ValueError, match="page_hash"):
         project.docquery.crop(output=output_path, bbox=[1, 2, 3, 4])
+
+
+async def test_async_crop_writes_output(tmp_path: Path, project_model: Project) -> None:
+    output_path = tmp_path / "nested" / "crop_async.png"
+    client = AsyncCropClient()
+    project = AsyncProjectInstance(client, project_model)
+
+    result = await project.docquery.crop(output=output_path, uuid="node-123")
+
+    with output_path.open("rb") as handle:
+        assert handle.read(8) == b"\x89PNG\r\n\x1a\n"
+    assert result.output_path == str(output_path)
+    assert client.requests[0].json == {"uuid": "node-123"}
+
+
+def test_crop_many_writes_each_output_in_order(
+    tmp_path: Path, client: CropClient, project: ProjectInstance
+) -> None:
+    outputs = [tmp_path / f"crop_{i}.png" for i in range(3)]
+
+    results = project.docquery.crop_many(
+        [{"output": path, "uuid": f"node-{i}"} for i, path in enumerate(outputs)],
+        max_concurrency=2,
+    )
+
+    assert [r.output_path for r in results] == [str(path) for path in outputs]
+    assert all(path.exists() for path in outputs)
+    assert sorted(r.json["uuid"] for r in client.requests) == ["node-0", "node-1", "node-2"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+
+from struai import _base
+
+pytest.importorskip("orjson")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "stdlib":
+        monkeypatch.setattr(_base, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"ok":true,"records":[{"uuid":"n1","score":0.25,"labels":["Callout"]}]}',
+        b'{"id":123456789012345678901234567890}',
+        b'{"value":NaN,"limit":Infinity}',
+        b'{"text":"\\ud800"}',
+        b'\xef\xbb\xbf{"ok":true}',
+    ],
+    ids=["plain", "big-int", "non-finite", "lone-surrogate", "bom"],
+)
+def test_decode_json_matches_stdlib(json_backend: str, body: bytes) -> None:
+    decoded = _base._decode_json(body)
+    expected = json.loads(body)
+
+    assert repr(decoded) == repr(expected)
+    assert all(type(a) is type(b) for a, b in zip(decoded.values(), expected.values()))
+
+
+@pytest.mark.parametrize(
+    ("payload", "error"),
+    [
+        ({"query": "MATCH (n) RETURN n", "params": {"name": "Détail 3"}, "max_rows": 5}, None),
+        ({"params": {"value": float("nan")}}, ValueError),
+        ({"params": {"at": datetime(2026, 1, 1)}}, TypeError),
+        ({"params": {"id": UUID(int=1)}}, TypeError),
+    ],
+    ids=["plain", "nan", "datetime", "uuid"],
+)
+def test_encode_json_matches_httpx(
+    json_backend: str, payload: dict[str, Any], error: type[Exception] | None
+) -> None:
+    if error is not None:
+        with pytest.raises(error):
+            _base._encode_json(payload)
+        return
+
+    request = httpx.Request("POST", "https://example.test", json=payload)
+    assert _base._encode_json(payload) == request.read()
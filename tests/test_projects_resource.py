@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import Any
 
-from struai.models.projects import JobStatus
-from struai.resources.projects import Job, JobBatch, ProjectInstance
+import pytest
+
+from struai import BatchIngestError, JobFailedError
+from struai.models.projects import JobStatus, Project
+from struai.resources.drawings import DEFAULT_CACHE_PROBE_SKIP_BYTES, _compute_file_hash
+from struai.resources.projects import (
+    _SHEET_LIST_QUERY,
+    _SHEET_SUMMARY_QUERY,
+    AsyncJob,
+    AsyncJobBatch,
+    Job,
+    JobBatch,
+    ProjectInstance,
+    Projects,
+    _poll_delays,
+)
 
 
 def _cypher_payload(records: list[dict[str, Any]]) -> dict[str, Any]:
@@ -13,136 +30,434 @@ def _cypher_payload(records: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+_SHEETS_SINGLE = {"jobs": [{"job_id": "job_single", "page": 1}]}
+_SHEETS_MULTI = {
+    "jobs": [
+        {"job_id": "job_a", "page": 1},
+        {"job_id": "job_b", "page": 2},
+    ]
+}
+_SEARCH_PAYLOAD = {
+    "ok": True,
+    "hits": [{"node": {"properties": {"uuid": "node_1"}}, "score": 0.9}],
+}
+_SHEET_SUMMARY_PAYLOAD = _cypher_payload(
+    [
+        {
+            "sheet_rows": [],
+            "label_rows": [{"label": "Callout", "count": 2}],
+            "rel_rows": [{"rel_type": "REFERENCES", "count": 5}],
+            "reachability_rows": [
+                {
+                    "has_sheet_node": False,
+                    "sheet_node_count": 0,
+                    "non_sheet_total": 3,
+                    "reachable_non_sheet": 1,
+                }
+            ],
+            "orphan_rows": [
+                {
+                    "uuid": "u1",
+                    "labels": ["Callout"],
+                    "category": "callout",
+                    "name": "A",
+                }
+            ],
+        }
+    ]
+)
+_DELETE_PAYLOAD = {
+    "deleted": True,
+    "project_id": "proj",
+    "projects_deleted": 1,
+    "nodes_deleted": 0,
+    "relationships_deleted": 0,
+    "owner_mapping_deleted": True,
+    "qdrant_deleted_points": 0,
+}
+
+
 class FakeClient:
     def __init__(self) -> None:
         self.status_calls = 0
         self.cypher_calls = 0
+        self.cache_probes = 0
+        self.search_calls = 0
+        self.last_get_params: dict[str, Any] | None = None
+        self._get_handlers = {"/projects/proj/search": self._search}
+        self._post_handlers = {
+            "/projects/proj/sheets": self._sheets,
+            "/projects/proj/cypher": self._cypher,
+        }
 
     def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        self.last_get_params = params
+        if path.startswith("/drawings/cache/"):
+            self.cache_probes += 1
+            return {"cached": False, "file_hash": path.split("/")[-1]}
+
         if path.startswith("/projects/proj/jobs/"):
-            self.status_calls += 1
-            payload = {
-                "job_id": path.split("/")[-1],
-                "status": "complete",
-                "result": {
-                    "sheet_id": f"sheet_{self.status_calls}",
-                    "entities_created": 10,
-                    "relationships_created": 20,
-                },
-                "status_log": [],
-                "step_timings": {},
-            }
-            return cast_to.model_validate(payload) if cast_to else payload
-
-        if path == "/projects/proj/search":
-            payload = {
-                "ok": True,
-                "hits": [{"node": {"properties": {"uuid": "node_1"}}, "score": 0.9}],
-            }
-            return cast_to.model_validate(payload) if cast_to else payload
-
-        raise AssertionError(f"unexpected GET {path}")
+            payload = self._job_status(path.split("/")[-1])
+        else:
+            handler = self._get_handlers.get(path)
+            if handler is None:
+                raise AssertionError(f"unexpected GET {path}")
+            payload = handler()
+        return cast_to.model_validate(payload) if cast_to else payload
 
     def post(self, path: str, *, files=None, data=None, json=None, cast_to=None):
-        if path == "/projects/proj/sheets":
-            page_selector = str((data or {}).get("page"))
-            if page_selector == "1":
-                payload = {"jobs": [{"job_id": "job_single", "page": 1}]}
-            else:
-                payload = {
-                    "jobs": [
-                        {"job_id": "job_a", "page": 1},
-                        {"job_id": "job_b", "page": 2},
-                    ]
-                }
-            return cast_to.model_validate(payload) if cast_to else payload
-
-        if path == "/projects/proj/cypher":
-            self.cypher_calls += 1
-            if self.cypher_calls == 1:
-                payload = _cypher_payload([])
-            elif self.cypher_calls == 2:
-                payload = _cypher_payload([{"label": "Callout", "count": 2}])
-            elif self.cypher_calls == 3:
-                payload = _cypher_payload([{"rel_type": "REFERENCES", "count": 5}])
-            elif self.cypher_calls == 4:
-                payload = _cypher_payload(
-                    [
-                        {
-                            "has_sheet_node": False,
-                            "sheet_node_count": 0,
-                            "non_sheet_total": 3,
-                            "reachable_non_sheet": 1,
-                        }
-                    ]
-                )
-            elif self.cypher_calls == 5:
-                payload = _cypher_payload(
-                    [{"uuid": "u1", "labels": ["Callout"], "category": "callout", "name": "A"}]
-                )
-            else:
-                raise AssertionError("unexpected cypher call count")
-            return cast_to.model_validate(payload) if cast_to else payload
-
-        raise AssertionError(f"unexpected POST {path}")
+        handler = self._post_handlers.get(path)
+        if handler is None:
+            raise AssertionError(f"unexpected POST {path}")
+        payload = handler(files=files, data=data)
+        return cast_to.model_validate(payload) if cast_to else payload
 
-    def delete(self, path: str, *, cast_to=None):
-        payload = {
-            "deleted": True,
-            "project_id": "proj",
-            "projects_deleted": 1,
-            "nodes_deleted": 0,
-            "relationships_deleted": 0,
-            "owner_mapping_deleted": True,
-            "qdrant_deleted_points": 0,
+    def _job_status(self, job_id: str) -> dict[str, Any]:
+        self.status_calls += 1
+        return {
+            "job_id": job_id,
+            "status": "complete",
+            "result": {
+                "sheet_id": f"sheet_{self.status_calls}",
+                "entities_created": 10,
+                "relationships_created": 20,
+            },
+            "status_log": [],
+            "step_timings": {},
         }
+
+    def _search(self) -> dict[str, Any]:
+        self.search_calls += 1
+        return _SEARCH_PAYLOAD
+
+    def _sheets(self, *, files=None, data=None) -> dict[str, Any]:
+        page_selector = str((data or {}).get("page"))
+        return _SHEETS_SINGLE if page_selector == "1" else _SHEETS_MULTI
+
+    def _cypher(self, *, files=None, data=None) -> dict[str, Any]:
+        self.cypher_calls += 1
+        if self.cypher_calls != 1:
+            raise AssertionError("unexpected cypher call count")
+        return _SHEET_SUMMARY_PAYLOAD
+
+    def delete(self, path: str, *, cast_to=None):
+        payload = _DELETE_PAYLOAD
         return cast_to.model_validate(payload) if cast_to else payload
 
 
-def test_single_page_ingest_returns_job() -> None:
-    client = FakeClient()
-    project = ProjectInstance(client, cast_to_project())
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def project(client: FakeClient, project_model: Project) -> ProjectInstance:
+    return ProjectInstance(client, project_model)
 
-    ingest = project.sheets.add(page=1, file_hash="abc123")
-    assert isinstance(ingest, Job)
 
-    status = ingest.status()
+def test_poll_delays_stay_positive_for_zero_intervals() -> None:
+    delays = _poll_delays(0, 0)
+
+    assert all(next(delays) > 0 for _ in range(5))
+
+
+@pytest.mark.parametrize(
+    ("page", "expected_cls", "expected_ids"),
+    [(1, Job, ["job_single"]), ("1,2", JobBatch, ["job_a", "job_b"])],
+)
+def test_ingest_returns_job_per_selected_page(
+    project: ProjectInstance, page: Any, expected_cls: type, expected_ids: list[str]
+) -> None:
+    ingest = project.sheets.add(page=page, file_hash="abc123")
+    assert isinstance(ingest, expected_cls)
+
+    jobs = ingest.jobs if isinstance(ingest, JobBatch) else [ingest]
+    assert [job.id for job in jobs] == expected_ids
+
+    status = jobs[0].status()
     assert isinstance(status, JobStatus)
     assert status.is_complete
 
-    result = ingest.wait(timeout=5, poll_interval=0)
-    assert result.sheet_id == "sheet_2"
-    assert result.entities_created == 10
+    if isinstance(ingest, JobBatch):
+        results = ingest.wait_all(timeout_per_job=5, poll_interval=0)
+    else:
+        results = [ingest.wait(timeout=5, poll_interval=0)]
+    assert len(results) == len(expected_ids)
+    assert all(result.sheet_id is not None for result in results)
+    assert all(result.entities_created == 10 for result in results)
+
 
+def test_add_many_queues_each_file(project: ProjectInstance) -> None:
+    ingests = project.sheets.add_many([b"%PDF-1.7 a", b"%PDF-1.7 b"], page=1)
 
-def test_multi_page_ingest_returns_batch() -> None:
+    assert len(ingests) == 2
+    assert all(isinstance(ingest, Job) for ingest in ingests)
+
+
+def test_long_poll_wait_requests_server_side_wait() -> None:
     client = FakeClient()
-    project = ProjectInstance(client, cast_to_project())
+    job = Job(client, "proj", "job_single", page=1)
 
-    ingest = project.sheets.add(page="1,2", file_hash="abc123")
-    assert isinstance(ingest, JobBatch)
-    assert ingest.ids == ["job_a", "job_b"]
+    result = job.wait(timeout=5, poll_interval=0, long_poll=True)
 
-    results = ingest.wait_all(timeout_per_job=5, poll_interval=0)
-    assert len(results) == 2
-    assert results[0].sheet_id is not None
-    assert results[1].sheet_id is not None
+    assert result.sheet_id == "sheet_1"
+    assert client.last_get_params is not None
+    assert 1 <= client.last_get_params["wait_seconds"] <= 5
 
 
-def test_docquery_search_parses_payload() -> None:
-    client = FakeClient()
-    project = ProjectInstance(client, cast_to_project())
+def test_small_bytes_upload_skips_cache_probe(client: FakeClient, project: ProjectInstance) -> None:
+    ingest = project.sheets.add(b"%PDF-1.7 tiny", page=1)
+    assert isinstance(ingest, Job)
+    assert client.cache_probes == 0
+
+
+class CacheFillingClient(FakeClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.uploads = 0
+        self.cached_hashes: set[str] = set()
+
+    def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        if path.startswith("/drawings/cache/"):
+            self.cache_probes += 1
+            return {"cached": path.split("/")[-1] in self.cached_hashes}
+        return super().get(path, params=params, cast_to=cast_to)
+
+    def _sheets(self, *, files=None, data=None) -> dict[str, Any]:
+        if files is not None:
+            self.uploads += 1
+            self.cached_hashes.add(_compute_file_hash(files["file"][1]))
+        return super()._sheets(files=files, data=data)
+
+
+def test_repeat_ingest_reuses_file_uploaded_earlier(project_model: Project) -> None:
+    client = CacheFillingClient()
+    sheets = ProjectInstance(client, project_model).sheets
+    pdf = b"%PDF-1.7 " + b"x" * (DEFAULT_CACHE_PROBE_SKIP_BYTES + 1)
+
+    for page in (1, 2, 3):
+        sheets.add(pdf, page=page)
+
+    assert client.uploads == 1
+    assert client.cache_probes == 2
+
+
+class ProjectListClient:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        assert path == "/projects"
+        return cast_to.model_validate(self.payload)
+
+
+@pytest.mark.parametrize("payload", [{"projects": None}, {}], ids=["null", "missing"])
+def test_project_list_treats_absent_projects_as_empty(payload: dict[str, Any]) -> None:
+    assert Projects(ProjectListClient(payload)).list() == []
+
+
+class AsyncStatusClient:
+    def __init__(self, failed_job_ids: frozenset[str] = frozenset()) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.failed_job_ids = failed_job_ids
+
+    async def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        job_id = path.split("/")[-1]
+        if job_id in self.failed_job_ids:
+            payload = {"job_id": job_id, "status": "failed", "error": "bad page"}
+        else:
+            payload = {"job_id": job_id, "status": "complete", "result": {}}
+        return cast_to.model_validate(payload)
+
+
+async def test_async_wait_all_respects_max_concurrency() -> None:
+    client = AsyncStatusClient()
+    batch = AsyncJobBatch([AsyncJob(client, "proj", f"job_{i}") for i in range(5)])
+
+    results = await batch.wait_all(timeout_per_job=5, poll_interval=0, max_concurrency=2)
+
+    assert len(results) == 5
+    assert client.peak_in_flight == 2
 
+
+async def test_async_wait_all_failure_creates_no_calls_it_never_starts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = AsyncStatusClient(failed_job_ids=frozenset({"job_0"}))
+    batch = AsyncJobBatch([AsyncJob(client, "proj", f"job_{i}") for i in range(3)])
+    created: list[str] = []
+    original_wait = AsyncJob.wait
+
+    def recording_wait(self: AsyncJob, *args: Any, **kwargs: Any):
+        created.append(self.id)
+        return original_wait(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncJob, "wait", recording_wait)
+
+    with pytest.raises(JobFailedError):
+        await batch.wait_all(timeout_per_job=5, poll_interval=0, max_concurrency=1)
+
+    assert "job_2" not in created
+
+
+class BlockingStatusClient:
+    """``job_slow`` blocks until released; every other job reports failure at once."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        job_id = path.split("/")[-1]
+        if job_id == "job_slow":
+            self.release.wait(5)
+            payload = {"job_id": job_id, "status": "complete", "result": {}}
+        else:
+            payload = {"job_id": job_id, "status": "failed", "error": "bad page"}
+        return cast_to.model_validate(payload)
+
+
+def test_wait_all_raises_first_failure_without_waiting_for_others() -> None:
+    client = BlockingStatusClient()
+    batch = JobBatch([Job(client, "proj", "job_slow"), Job(client, "proj", "job_bad")])
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(JobFailedError):
+            batch.wait_all(timeout_per_job=5, poll_interval=0)
+        assert time.monotonic() - started < 1
+    finally:
+        client.release.set()
+
+
+class PendingStatusClient:
+    """``job_pending`` never finishes; every other job reports failure at once."""
+
+    def __init__(self) -> None:
+        self.pending_polls = 0
+
+    def get(self, path: str, params: dict[str, Any] | None = None, cast_to=None):
+        job_id = path.split("/")[-1]
+        if job_id == "job_pending":
+            self.pending_polls += 1
+            payload = {"job_id": job_id, "status": "processing"}
+        else:
+            payload = {"job_id": job_id, "status": "failed", "error": "bad page"}
+        return cast_to.model_validate(payload)
+
+
+def test_wait_all_failure_stops_other_waits_polling() -> None:
+    client = PendingStatusClient()
+    batch = JobBatch([Job(client, "proj", "job_pending"), Job(client, "proj", "job_bad")])
+
+    with pytest.raises(JobFailedError):
+        batch.wait_all(timeout_per_job=5, poll_interval=0)
+    threading.Event().wait(0.05)
+    polls = client.pending_polls
+    threading.Event().wait(0.1)
+
+    assert client.pending_polls == polls
+
+
+class FlakyUploadClient(FakeClient):
+    def _sheets(self, *, files=None, data=None) -> dict[str, Any]:
+        if files is not None and b"broken" in files["file"][1]:
+            raise RuntimeError("upload rejected")
+        return super()._sheets(files=files, data=data)
+
+
+def test_add_many_failure_keeps_already_queued_jobs(project_model: Project) -> None:
+    project = ProjectInstance(FlakyUploadClient(), project_model)
+
+    with pytest.raises(BatchIngestError) as excinfo:
+        project.sheets.add_many(
+            [b"%PDF-1.7 a", b"%PDF-1.7 broken", b"%PDF-1.7 c"], page=1, max_concurrency=1
+        )
+
+    assert isinstance(excinfo.value.results[0], Job)
+    assert excinfo.value.results[1:] == [None, None]
+    assert list(excinfo.value.errors) == [1]
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+
+
+def test_docquery_search_parses_payload(project: ProjectInstance) -> None:
     response = project.docquery.search("beam", limit=10)
     assert len(response.hits) == 1
     assert response.hits[0].score == 0.9
     assert response.hits[0].node["properties"]["uuid"] == "node_1"
 
 
-def test_docquery_sheet_summary_returns_warning_payload() -> None:
-    client = FakeClient()
-    project = ProjectInstance(client, cast_to_project())
+def test_docquery_search_reuses_cached_result_until_cleared(
+    client: FakeClient, project: ProjectInstance
+) -> None:
+    project.docquery.cache_enable(ttl=60)
+
+    first = project.docquery.search("beam", limit=10)
+    second = project.docquery.search(" beam ", limit=10)
+    assert second == first
+    assert second is not first
+    assert client.search_calls == 1
+    assert project.docquery.cache_info()["hits"] == 1
+
+    project.docquery.search("beam", limit=5)
+    assert client.search_calls == 2
+
+    project.docquery.cache_clear()
+    project.docquery.search("beam", limit=10)
+    assert client.search_calls == 3
+
+
+def test_docquery_reads_are_not_cached_by_default(
+    client: FakeClient, project: ProjectInstance
+) -> None:
+    project.docquery.search("beam", limit=10)
+    project.docquery.search("beam", limit=10)
+
+    assert client.search_calls == 2
+    assert project.docquery.cache_info()["size"] == 0
+
+
+def test_completed_job_drops_cached_reads(client: FakeClient, project: ProjectInstance) -> None:
+    project.docquery.cache_enable(ttl=60)
+    job = project.sheets.job("job_single", page=1)
 
+    project.docquery.search("beam", limit=10)
+    project.docquery.search("beam", limit=10)
+    assert client.search_calls == 1
+
+    job.wait(timeout=5, poll_interval=0)
+    project.docquery.search("beam", limit=10)
+    assert client.search_calls == 2
+
+
+@pytest.mark.parametrize(
+    ("query", "search_calls"),
+    [
+        ("MATCH (n:Entity) RETURN n.uuid LIMIT 5", 1),
+        ("MATCH (n:Entity {uuid: $uuid}) SET n.name = $name", 2),
+        ("match (n:Entity {uuid: $uuid}) detach delete n", 2),
+    ],
+    ids=["read", "set", "delete"],
+)
+def test_docquery_cypher_clears_cached_reads_only_for_writes(
+    client: FakeClient, project: ProjectInstance, query: str, search_calls: int
+) -> None:
+    project.docquery.cache_enable(ttl=60)
+    project.docquery.search("beam", limit=10)
+
+    project.docquery.cypher(query)
+    project.docquery.search("beam", limit=10)
+
+    assert client.search_calls == search_calls
+
+
+def test_docquery_sheet_summary_returns_warning_payload(
+    client: FakeClient, project: ProjectInstance
+) -> None:
     response = project.docquery.sheet_summary("S111", orphan_limit=5)
 
     assert response.command == "sheet-summary"
@@ -152,9 +467,154 @@ def test_docquery_sheet_summary_returns_warning_payload() -> None:
     assert "missing_sheet_node" in warning_types
     assert "unreachable_entities" in warning_types
     assert len(response.orphan_examples) == 1
+    assert client.cypher_calls == 1
+
+
+def _call_bodies(query: str) -> list[str]:
+    bodies = []
+    start = query.find("CALL {")
+    while start != -1:
+        depth = 0
+        for end in range(start + len("CALL "), len(query)):
+            depth += {"{": 1, "}": -1}.get(query[end], 0)
+            if depth == 0:
+                break
+        bodies.append(query[start + len("CALL {") : end])
+        start = query.find("CALL {", end)
+    return bodies
+
+
+@pytest.mark.parametrize(
+    "query", [_SHEET_SUMMARY_QUERY, _SHEET_LIST_QUERY], ids=["sheet-summary", "sheet-list"]
+)
+def test_docquery_section_subqueries_always_yield_one_row(query: str) -> None:
+    # A subquery returning zero rows would drop the outer row and with it every section.
+    bodies = _call_bodies(query)
+    assert bodies
+    for body in bodies:
+        final_return = body.rsplit("RETURN", 1)[1].strip()
+        assert final_return.startswith(("collect(", "count(")), body
+
+
+class CypherRowClient:
+    """Answers every cypher call with one already-folded result row."""
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        self.row = row
+        self.last_json: dict[str, Any] | None = None
+
+    def post(self, path: str, *, json=None, cast_to=None):
+        assert path == "/projects/proj/cypher"
+        self.last_json = json
+        return cast_to.model_validate(_cypher_payload([self.row]))
+
+
+def test_docquery_sheet_summary_accepts_empty_sections(project_model: Project) -> None:
+    client = CypherRowClient(
+        {
+            "sheet_rows": [{"sheet_id": "S111", "uuid": "s111", "name": "S111"}],
+            "label_rows": [],
+            "rel_rows": [],
+            "reachability_rows": [
+                {
+                    "has_sheet_node": True,
+                    "sheet_node_count": 1,
+                    "non_sheet_total": 0,
+                    "reachable_non_sheet": 0,
+                }
+            ],
+            "orphan_rows": [],
+        }
+    )
+    project = ProjectInstance(client, project_model)
+
+    response = project.docquery.sheet_summary("S111")
+
+    assert response.sheet_node == {"sheet_id": "S111", "uuid": "s111", "name": "S111"}
+    assert response.reachability["has_sheet_node"] is True
+    assert response.node_label_counts == []
+    assert response.relationship_counts == []
+    assert response.orphan_examples == []
+    assert response.warnings == []
+
+
+def test_docquery_sheet_list_returns_page_cursor(project_model: Project) -> None:
+    client = CypherRowClient(
+        {
+            "sheet_nodes": [{"sheet_id": "S1", "uuid": "s1", "name": "S1"}],
+            "inventory": [{"sheet_id": "S1", "entity_count": 4}],
+            "duplicate_sheet_nodes": [],
+            "missing_sheet_id_count": 0,
+            "next_after_sheet_id": "S1",
+        }
+    )
+    project = ProjectInstance(client, project_model)
+
+    response = project.docquery.sheet_list(after_sheet_id="S0", limit=1)
+
+    assert client.last_json is not None
+    assert client.last_json["params"] == {"after_sheet_id": "S0", "limit": 1}
+    assert response.next_after_sheet_id == "S1"
+    assert response.totals["total_entities"] == 4
+    assert response.mismatch_warnings == []
+
+
+def test_docquery_sheet_list_accepts_empty_project(project_model: Project) -> None:
+    client = CypherRowClient(
+        {
+            "sheet_nodes": [],
+            "inventory": [],
+            "duplicate_sheet_nodes": [],
+            "missing_sheet_id_count": 0,
+            "next_after_sheet_id": None,
+        }
+    )
+    project = ProjectInstance(client, project_model)
+
+    response = project.docquery.sheet_list()
+
+    assert response.sheet_nodes == []
+    assert response.totals["total_entities"] == 0
+    assert response.mismatch_warnings == []
+    assert response.next_after_sheet_id is None
+
+
+class IntegerSheetIdClient:
+    """Pages integer sheet_ids the way the list query does: by their string form."""
+
+    def __init__(self, sheet_ids: list[int]) -> None:
+        self.sheet_ids = sheet_ids
+        self.calls: list[dict[str, Any]] = []
+
+    def post(self, path: str, *, json=None, cast_to=None):
+        assert "toString(n.sheet_id) > $after_sheet_id" in json["query"]
+        params = json["params"]
+        self.calls.append(params)
+        after = params["after_sheet_id"]
+        keys = sorted(str(sid) for sid in self.sheet_ids if after is None or str(sid) > after)
+        page = keys[: params["limit"]]
+        row = {
+            "sheet_nodes": [{"sheet_id": int(key), "uuid": f"s{key}"} for key in page],
+            "inventory": [{"sheet_id": key, "entity_count": 1} for key in page],
+            "duplicate_sheet_nodes": [],
+            "missing_sheet_id_count": 0,
+            "next_after_sheet_id": page[-1] if len(page) >= params["limit"] else None,
+        }
+        return cast_to.model_validate(_cypher_payload([row]))
+
 
+def test_docquery_sheet_list_pages_through_integer_sheet_ids(project_model: Project) -> None:
+    client = IntegerSheetIdClient([3, 7, 12, 40, 100])
+    project = ProjectInstance(client, project_model)
 
-def cast_to_project():
-    from struai.models.projects import Project
+    seen: list[Any] = []
+    cursor = None
+    while True:
+        response = project.docquery.sheet_list(after_sheet_id=cursor, limit=2)
+        seen.extend(node["sheet_id"] for node in response.sheet_nodes)
+        cursor = response.next_after_sheet_id
+        if cursor is None:
+            break
 
-    return Project.model_validate({"id": "proj", "name": "Smoke"})
+    assert sorted(seen) == [3, 7, 12, 40, 100]
+    assert [call["after_sheet_id"] for call in client.calls] == [None, "12", "40"]